@@ -0,0 +1,22 @@
+# Shared helpers for the benchmark scripts: import path setup and scaled test data.
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+CSV_PATH = os.path.join(ROOT, 'data', 'WA_Fn-UseC_-HR-Employee-Attrition.csv')
+
+from synth import synthetic_frame  # noqa: E402 (needs the path above)
+
+
+def scaled_frame(n_rows, seed=0):
+    # Synthetic employees (src/synth.py) with the sample CSV's distributions and unique
+    # EmployeeNumbers 1..n_rows.
+    return synthetic_frame(n_rows, seed=seed, source=pd.read_csv(CSV_PATH))
+
+
+def parse_scales(text):
+    return [int(float(s)) for s in text.split(',') if s]
@@ -0,0 +1,103 @@
+# =========================
+# Benchmark: SQL vs pandas per HR question
+# =========================
+# Runs every question of the analytics registry (the nine questions from app.py) on both
+# engines at several data scales: the SQLite query against the migrated employee table,
+# and the pandas implementation against the compact in-memory frame the dashboard holds.
+# Both answers are checked for equality, and the faster engine is recommended per question.
+# Exits with status 1 if any question's answers disagree.
+#
+# Usage (from the repository root):
+#   python benchmarks/bench_analytics.py --scales 10000,100000,1000000 --json > analytics.json
+# =========================
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from _data import parse_scales, scaled_frame
+from analytics import QUESTIONS, results_equal, run_pandas, run_sql
+from database import migrate
+from frames import optimize_employee_frame
+
+
+def time_it(fn, repeats):
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def bench_scale(conn, frame, repeats):
+    results = {}
+    for key, q in QUESTIONS.items():
+        sql_ms, sql_result = time_it(lambda: run_sql(conn, q), repeats)
+        pandas_ms, pandas_result = time_it(lambda: run_pandas(frame, q), repeats)
+        results[key] = {
+            'sql_ms': round(sql_ms, 3),
+            'pandas_ms': round(pandas_ms, 3),
+            'equal': results_equal(sql_result, pandas_result, q),
+            'faster': 'sql' if sql_ms < pandas_ms else 'pandas',
+        }
+    return results
+
+
+def recommend(report):
+    # Per question: the engine that wins at the largest scale, plus where the winner changes.
+    scales = sorted(report)
+    recommendations = {}
+    for key in QUESTIONS:
+        winners = [report[n]['questions'][key]['faster'] for n in scales]
+        recommendations[key] = {
+            'engine': winners[-1],
+            'by_scale': dict(zip(scales, winners)),
+        }
+    return recommendations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQL vs pandas for each HR analysis question.")
+    parser.add_argument('--scales', default='10000,100000,1000000')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in parse_scales(args.scales):
+            df = scaled_frame(n_rows)
+            conn = sqlite3.connect(os.path.join(tmp, f'employees-{n_rows}.db'))
+            df.to_sql('employee', conn, index=False)
+            migrate(conn)
+            frame = optimize_employee_frame(df)
+            report[n_rows] = {'questions': bench_scale(conn, frame, args.repeats)}
+            conn.close()
+    mismatches = [(n, key) for n, r in report.items() for key, q in r['questions'].items() if not q['equal']]
+    output = {
+        'scales': report,
+        'recommendations': recommend(report),
+        'mismatches': [{'rows': n, 'question': key} for n, key in mismatches],
+    }
+
+    if args.json:
+        print(json.dumps(output, indent=2))
+    else:
+        for n_rows, result in report.items():
+            print(f"\n{n_rows:,} rows{'':26} {'sql ms':>9} {'pandas ms':>10} {'faster':>7}  equal")
+            for key, q in result['questions'].items():
+                print(f"  {key:32} {q['sql_ms']:9.2f} {q['pandas_ms']:10.2f} {q['faster']:>7}  {q['equal']}")
+        print("\nRecommended engine (largest scale):")
+        for key, rec in output['recommendations'].items():
+            print(f"  {key:32} {rec['engine']}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# =========================
+# Benchmark: Dashboard Import Time
+# =========================
+# Runs the top-level imports of src/dashboard.py in a fresh interpreter with
+# `python -X importtime` and reports the total and the heaviest packages. Also measures
+# what the lazily imported stacks (scikit-learn, joblib) and the removed plotting
+# libraries would add on top, and checks that the dashboard imports do not load them.
+#
+# Usage (from the repository root):
+#   python benchmarks/bench_imports.py --top 15
+# =========================
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+from _data import ROOT
+
+DASHBOARD = os.path.join(ROOT, 'src', 'dashboard.py')
+DEFERRED = ['sklearn.ensemble', 'sklearn.model_selection', 'sklearn.metrics', 'joblib', 'seaborn', 'matplotlib.pyplot']
+
+
+def dashboard_imports():
+    # Source of the module-level import statements of dashboard.py.
+    tree = ast.parse(open(DASHBOARD).read())
+    return '\n'.join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def importtime(code):
+    # [(module, self_us, cumulative_us, depth)] in import order, for `code` run from src/.
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=os.path.join(ROOT, 'src'), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile of the dashboard's module imports.")
+    parser.add_argument('--top', type=int, default=15, help="Heaviest top-level packages to list")
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    base_code = dashboard_imports()
+    interpreter = {row[0] for row in importtime('pass')}  # Loaded by interpreter startup
+    base = importtime(base_code)
+    top_level = [row for row in base if row[3] == 0 and row[0] not in interpreter]
+    loaded = {row[0] for row in base}
+    report = {
+        'dashboard imports (ms)': sum(row[2] for row in top_level) / 1000,
+        'heaviest (ms)': {
+            name: cumulative / 1000
+            for name, _, cumulative, _ in sorted(top_level, key=lambda row: row[2], reverse=True)[:args.top]
+        },
+        'deferred (ms on top of dashboard imports)': {},
+        'deferred loaded by dashboard imports': sorted(m for m in DEFERRED if m in loaded),
+    }
+    for module in DEFERRED:
+        # Rows are printed as imports finish, so the extra statement's rows come after the base ones.
+        extra = importtime(f"{base_code}\nimport {module}")[len(base):]
+        report['deferred (ms on top of dashboard imports)'][module] = sum(row[2] for row in extra if row[3] == 0) / 1000
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"Dashboard module imports: {report['dashboard imports (ms)']:.0f} ms (one sample; re-run to compare)")
+    print("\nHeaviest top-level imports:")
+    for name, ms in report['heaviest (ms)'].items():
+        print(f"  {name:32} {ms:8.1f} ms")
+    print("\nLazily imported / removed, cost if imported at startup:")
+    for name, ms in report['deferred (ms on top of dashboard imports)'].items():
+        print(f"  {name:32} {ms:8.1f} ms")
+    if report['deferred loaded by dashboard imports']:
+        print("\nWARNING: loaded by the dashboard imports:", ', '.join(report['deferred loaded by dashboard imports']))
+
+
+if __name__ == '__main__':
+    main()
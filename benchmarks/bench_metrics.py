@@ -0,0 +1,96 @@
+# =========================
+# Benchmark: Dashboard Metrics Engine
+# =========================
+# Compares the original per-chart pandas code (one filter / groupby / value_counts pass per
+# KPI and chart) with the single-pass engine in metrics.py, on object and on categorical
+# columns, and checks that both produce the same numbers.
+#
+# Usage (from the repository root):
+#   python benchmarks/bench_metrics.py --scales 10000,100000,1000000
+# =========================
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from _data import parse_scales, scaled_frame
+from database import SUMMARY_DIMENSIONS
+from metrics import compute_metrics
+
+
+def per_chart_metrics(df):
+    # The dashboard's original pandas code, one pass per metric.
+    out = {}
+    out['not_left'] = df[df['Attrition'] == 'No'].shape[0]
+    out['total'] = df.shape[0]
+    out['left'] = df[df['Attrition'] == 'Yes'].shape[0]
+    out['avg_income'] = df['MonthlyIncome'].mean()
+    out['dept'] = df.groupby('Department').size()
+    out['role_income'] = df.groupby('JobRole')['MonthlyIncome'].mean()
+    counts = df.groupby(['Department', 'JobRole'])['Attrition'].value_counts().unstack().fillna(0)
+    out['dept_role_rate'] = (counts['Yes'] / counts.sum(axis=1) * 100).round(2)
+    out['dept_role_total'] = df.groupby(['Department', 'JobRole']).size()
+    out['perf'] = df.groupby(['PerformanceRating', 'Attrition']).size().unstack(fill_value=0)
+    ot = df.groupby(['JobRole', 'OverTime'])['Attrition'].value_counts().unstack(fill_value=0)
+    ot['EmployeeCount'] = ot.sum(axis=1)
+    ot['AttritionRate'] = (ot['Yes'] / ot['EmployeeCount'] * 100).round(2)
+    out['role_ot'] = ot
+    out['income_attr'] = df.groupby('Attrition')['MonthlyIncome'].mean()
+    out['best_dept'] = df.groupby('Department')['PerformanceRating'].mean().idxmax()
+    return out
+
+
+def check_equal(ref, m):
+    assert ref['not_left'] == m.not_left_count and ref['total'] == m.total_employees
+    assert ref['left'] == m.attrition_count and np.isclose(ref['avg_income'], m.avg_monthly_income)
+    assert ref['dept'].tolist() == m.department_counts['EmployeeCount'].tolist()
+    assert np.allclose(ref['role_income'].to_numpy(), m.average_income_by_role['AverageMonthlyIncome'])
+    assert np.allclose(ref['dept_role_rate'].to_numpy(), m.attrition_by_department_role['AttritionRate'])
+    assert ref['dept_role_total'].tolist() == m.attrition_by_department_role['TotalEmployees'].tolist()
+    assert ref['perf']['Yes'].tolist() == m.performance_vs_attrition['Yes'].tolist()
+    assert np.allclose(ref['role_ot']['AttritionRate'].to_numpy(), m.attrition_by_role_overtime['AttritionRate'])
+    assert np.allclose(ref['income_attr'].to_numpy(), m.income_by_attrition['MonthlyIncome'])
+    assert ref['best_dept'] == m.best_department[0]
+
+
+def best_of(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-chart pandas vs single-pass metrics engine.")
+    parser.add_argument('--scales', default='10000,100000,1000000')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    report = {}
+    for n_rows in parse_scales(args.scales):
+        df = scaled_frame(n_rows)
+        categorical = df.astype({dim: 'category' for dim in SUMMARY_DIMENSIONS})
+        check_equal(per_chart_metrics(df), compute_metrics(df))
+        check_equal(per_chart_metrics(df), compute_metrics(categorical))
+        report[n_rows] = {
+            'per-chart pandas': best_of(lambda: per_chart_metrics(df), args.repeats),
+            'single pass': best_of(lambda: compute_metrics(df), args.repeats),
+            'single pass (categorical)': best_of(lambda: compute_metrics(categorical), args.repeats),
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for n_rows, result in report.items():
+        print(f"\n{n_rows:,} rows")
+        for case, ms in result.items():
+            print(f"  {case:28} {ms:10.2f} ms  {result['per-chart pandas'] / ms:6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
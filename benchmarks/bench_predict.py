@@ -0,0 +1,60 @@
+# =========================
+# Benchmark: Attrition Prediction Latency
+# =========================
+# Times single-employee and 1k-row scoring with the fitted feature pipeline against the
+# DataFrame path, using the latest persisted model (or a fresh one on the sample CSV).
+#
+# Usage (from the repository root):
+#   python benchmarks/bench_predict.py --repeats 500
+# =========================
+
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from _data import CSV_PATH
+from model import load_latest_model, predict_attrition_risk, train_model
+
+
+def time_calls(fn, repeats):
+    timings = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        fn(i)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {'p50_ms': float(np.percentile(timings, 50)), 'p95_ms': float(np.percentile(timings, 95))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeats', type=int, default=500)
+    parser.add_argument('--json', action='store_true', help="Print a JSON report instead of a table")
+    args = parser.parse_args()
+
+    df = pd.read_csv(CSV_PATH)
+    bundle = load_latest_model() or train_model(df)
+    records = df.to_dict('records')
+    batch = df.sample(1000, replace=True, random_state=0)
+
+    results = {
+        '1 row, record pipeline (predict_one)': time_calls(
+            lambda i: bundle.predict_one(records[i % len(records)]), args.repeats),
+        '1 row, DataFrame pipeline + forest predict_proba': time_calls(
+            lambda i: bundle.model.predict_proba(bundle.pipeline.transform(df.iloc[[i % len(df)]])[0]), args.repeats),
+        '1k rows, DataFrame pipeline (predict_attrition_risk)': time_calls(
+            lambda i: predict_attrition_risk(bundle, batch), max(args.repeats // 20, 5)),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'case':55} {'p50 ms':>9} {'p95 ms':>9}")
+    for case, stats in results.items():
+        print(f"{case:55} {stats['p50_ms']:9.3f} {stats['p95_ms']:9.3f}")
+
+
+if __name__ == '__main__':
+    main()
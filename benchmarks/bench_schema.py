@@ -0,0 +1,90 @@
+# =========================
+# Benchmark: Employee Table Schema
+# =========================
+# Compares the implicit pandas.to_sql table (no key, no indexes) with the migrated schema
+# (EmployeeNumber INTEGER PRIMARY KEY + secondary indexes) for the dashboard's point
+# lookups / updates and its GROUP BY / ORDER BY queries.
+#
+# Usage (from the repository root):
+#   python benchmarks/bench_schema.py --scales 100000,1000000
+# =========================
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from _data import parse_scales, scaled_frame
+from database import migrate
+
+QUERIES = {
+    'count not left': "SELECT COUNT(*) FROM employee WHERE Attrition = 'No'",
+    'group by department': "SELECT Department, COUNT(*) FROM employee GROUP BY Department",
+    'avg income by job role': "SELECT JobRole, AVG(MonthlyIncome) FROM employee GROUP BY JobRole",
+    'top 5 by performance': "SELECT EmployeeNumber, PerformanceRating FROM employee ORDER BY PerformanceRating DESC LIMIT 5",
+}
+
+
+def time_it(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def bench_db(conn, n_rows, lookups):
+    ids = [random.randint(1, n_rows) for _ in range(lookups)]
+    results = {
+        f'{lookups} point SELECTs': time_it(lambda: [
+            conn.execute("SELECT MonthlyIncome FROM employee WHERE EmployeeNumber = ?", (i,)).fetchone() for i in ids
+        ], 1),
+        f'{lookups} point UPDATEs': time_it(lambda: [
+            conn.execute("UPDATE employee SET MonthlyIncome = MonthlyIncome WHERE EmployeeNumber = ?", (i,)) for i in ids
+        ], 1),
+    }
+    conn.rollback()
+    for name, sql in QUERIES.items():
+        results[name] = time_it(lambda: conn.execute(sql).fetchall(), 3)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Legacy vs migrated employee schema.")
+    parser.add_argument('--scales', default='100000,1000000')
+    parser.add_argument('--lookups', type=int, default=200)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in parse_scales(args.scales):
+            df = scaled_frame(n_rows)
+            legacy = sqlite3.connect(os.path.join(tmp, f'legacy-{n_rows}.db'))
+            df.to_sql('employee', legacy, index=False)
+            migrated = sqlite3.connect(os.path.join(tmp, f'migrated-{n_rows}.db'))
+            df.to_sql('employee', migrated, index=False)
+            migrate(migrated)
+            report[n_rows] = {
+                'legacy': bench_db(legacy, n_rows, args.lookups),
+                'migrated': bench_db(migrated, n_rows, args.lookups),
+            }
+            legacy.close()
+            migrated.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for n_rows, result in report.items():
+        print(f"\n{n_rows:,} rows{'':32} {'legacy ms':>11} {'migrated ms':>12} {'speedup':>8}")
+        for case, legacy_ms in result['legacy'].items():
+            migrated_ms = result['migrated'][case]
+            print(f"  {case:38} {legacy_ms:11.2f} {migrated_ms:12.2f} {legacy_ms / max(migrated_ms, 1e-9):7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
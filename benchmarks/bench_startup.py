@@ -0,0 +1,73 @@
+# =========================
+# Benchmark: Cold-Start Employee Frame Load
+# =========================
+# Time to get the dashboard's compact employee frame from each source: parsing the CSV
+# text, read_sql of the SQLite `employee` table, and the memory-mapped Arrow IPC cache
+# (frame_cache.py). All three produce the same frame, which is checked.
+#
+# Usage (from the repository root):
+#   python benchmarks/bench_startup.py --scales 10000,100000,1000000
+# =========================
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from _data import parse_scales, scaled_frame
+from database import connect, migrate
+from frame_cache import cache_key, read_frame_cache, write_frame_cache
+from frames import load_employee_frame, optimize_employee_frame
+from ingest import ingest_csv
+
+import pandas as pd
+
+
+def time_it(fn, repeats):
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV parse vs read_sql vs columnar cache load.")
+    parser.add_argument('--scales', default='10000,100000,1000000')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in parse_scales(args.scales):
+            csv_path = os.path.join(tmp, f'employees-{n_rows}.csv')
+            scaled_frame(n_rows).to_csv(csv_path, index=False)
+            conn = connect(os.path.join(tmp, f'hr-{n_rows}.db'))
+            migrate(conn)
+            ingest_csv(conn, csv_path)
+            cache_dir = os.path.join(tmp, f'cache-{n_rows}')
+            frame, memory_report = load_employee_frame(conn)
+            write_frame_cache(frame, cache_key(conn), memory_report, cache_dir)
+
+            csv_ms, from_csv = time_it(lambda: optimize_employee_frame(pd.read_csv(csv_path)), args.repeats)
+            sql_ms, (from_sql, _) = time_it(lambda: load_employee_frame(conn), args.repeats)
+            arrow_ms, (from_cache, _) = time_it(lambda: read_frame_cache(cache_key(conn), cache_dir), args.repeats)
+            pd.testing.assert_frame_equal(from_sql, from_cache)
+            pd.testing.assert_frame_equal(from_csv, from_sql, check_dtype=False, check_categorical=False)
+            report[n_rows] = {'csv parse': csv_ms, 'read_sql': sql_ms, 'arrow ipc (mmap)': arrow_ms}
+            conn.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for n_rows, result in report.items():
+        print(f"\n{n_rows:,} rows")
+        for case, ms in result.items():
+            print(f"  {case:18} {ms:10.2f} ms  {result['csv parse'] / ms:6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
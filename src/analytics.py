@@ -0,0 +1,146 @@
+
+# =========================
+# HR Analysis Questions
+# =========================
+# The nine HR questions from app.py as a registry. Each question has a SQLite query and an
+# equivalent pandas implementation; both return a DataFrame with the same columns, so the
+# answers can be compared (results_equal) and the two engines timed against each other
+# (benchmarks/bench_analytics.py).
+# =========================
+
+# --- Import Libraries ---
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+# --- Registry ---
+@dataclass(frozen=True)
+class Question:
+    key: str
+    title: str
+    sql: str
+    columns: tuple  # Result columns (SQL rows are labelled with these)
+    pandas: Callable  # employee DataFrame -> result DataFrame
+    compare: tuple = None  # Columns compared between engines (default: all); excludes tie-dependent ones
+    ordered: bool = False  # Compare row order too (otherwise rows are sorted first)
+
+
+QUESTIONS = {}
+
+
+def question(key, title, sql, columns, compare=None, ordered=False):
+    # Decorator registering a pandas implementation together with its SQL query.
+    def register(fn):
+        QUESTIONS[key] = Question(key, title, sql, tuple(columns), fn, compare and tuple(compare), ordered)
+        return fn
+    return register
+
+
+# --- Engines ---
+def run_sql(conn, q):
+    return pd.DataFrame(conn.execute(q.sql).fetchall(), columns=list(q.columns))
+
+
+def run_pandas(df, q):
+    return q.pandas(df)[list(q.columns)].reset_index(drop=True)
+
+
+def results_equal(sql_result, pandas_result, q, atol=0.01):
+    # Same rows (in order, if the question is ordered); numbers within `atol` (both engines
+    # round rates to 2 decimals, but not always in the same direction for halves).
+    columns = list(q.compare or q.columns)
+    a, b = sql_result[columns], pandas_result[columns]
+    if len(a) != len(b):
+        return False
+    if not q.ordered:
+        a = a.sort_values(columns).reset_index(drop=True)
+        b = b.sort_values(columns).reset_index(drop=True)
+    for col in columns:
+        left, right = a[col].to_numpy(), b[col].to_numpy()
+        if pd.api.types.is_numeric_dtype(a[col]) and pd.api.types.is_numeric_dtype(b[col]):
+            if not np.allclose(left.astype(float), right.astype(float), atol=atol, rtol=0):
+                return False
+        elif not (a[col].astype(str).to_numpy() == b[col].astype(str).to_numpy()).all():
+            return False
+    return True
+
+
+# --- Questions ---
+@question('not_left', "How many employees have not left the company?",
+          "SELECT COUNT(*) FROM employee WHERE Attrition = 'No';",
+          ['Employees'])
+def not_left(df):
+    return pd.DataFrame({'Employees': [df[df['Attrition'] == 'No'].shape[0]]})
+
+
+@question('department_counts', "What is the employee count for each department?",
+          "SELECT Department, COUNT(*) as EmployeeCount FROM employee GROUP BY Department;",
+          ['Department', 'EmployeeCount'])
+def department_counts(df):
+    return df.groupby('Department', observed=True).size().reset_index(name='EmployeeCount')
+
+
+@question('income_by_role', "What is the average monthly income for employees in each job role?",
+          "SELECT JobRole, AVG(MonthlyIncome) as AverageMonthlyIncome FROM employee GROUP BY JobRole;",
+          ['JobRole', 'AverageMonthlyIncome'])
+def income_by_role(df):
+    return df.groupby('JobRole', observed=True)['MonthlyIncome'].mean().reset_index(name='AverageMonthlyIncome')
+
+
+# Many employees share the top rating, so the engines may pick different ones: only the ratings are compared.
+@question('top5_performance', "Who are the top 5 employees by performance rating?",
+          "SELECT EmployeeNumber, PerformanceRating FROM employee ORDER BY PerformanceRating DESC LIMIT 5;",
+          ['EmployeeNumber', 'PerformanceRating'], compare=['PerformanceRating'], ordered=True)
+def top5_performance(df):
+    return df.sort_values('PerformanceRating', ascending=False)[['EmployeeNumber', 'PerformanceRating']].head(5)
+
+
+@question('best_department', "Which department has the highest average performance rating?",
+          "SELECT Department, AVG(PerformanceRating) as AvgPerformanceRating "
+          "FROM employee GROUP BY Department ORDER BY AvgPerformanceRating DESC LIMIT 1;",
+          ['Department', 'AvgPerformanceRating'])
+def best_department(df):
+    dept_avg_perf = df.groupby('Department', observed=True)['PerformanceRating'].mean()
+    return pd.DataFrame({'Department': [dept_avg_perf.idxmax()], 'AvgPerformanceRating': [dept_avg_perf.max()]})
+
+
+@question('attrition_by_department_role', "What is the attrition rate by department and job role?",
+          "SELECT Department, JobRole, "
+          "ROUND(SUM(CASE WHEN Attrition='Yes' THEN 1 ELSE 0 END)*100.0/COUNT(*),2) AS AttritionRate "
+          "FROM employee GROUP BY Department, JobRole ORDER BY AttritionRate DESC;",
+          ['Department', 'JobRole', 'AttritionRate'])
+def attrition_by_department_role(df):
+    counts = df.groupby(['Department', 'JobRole'], observed=True)['Attrition'].value_counts().unstack().fillna(0)
+    rate = (counts['Yes'] / counts.sum(axis=1) * 100).round(2)
+    return rate.sort_values(ascending=False).reset_index(name='AttritionRate')
+
+
+@question('income_by_attrition', "Is there a correlation between monthly income and attrition?",
+          "SELECT Attrition, AVG(MonthlyIncome) FROM employee GROUP BY Attrition;",
+          ['Attrition', 'AverageMonthlyIncome'])
+def income_by_attrition(df):
+    return df.groupby('Attrition', observed=True)['MonthlyIncome'].mean().reset_index(name='AverageMonthlyIncome')
+
+
+@question('performance_vs_attrition', "How does performance rating relate to attrition?",
+          "SELECT PerformanceRating, Attrition, COUNT(*) FROM employee "
+          "GROUP BY PerformanceRating, Attrition ORDER BY PerformanceRating DESC;",
+          ['PerformanceRating', 'Attrition', 'Count'])
+def performance_vs_attrition(df):
+    return df.groupby(['PerformanceRating', 'Attrition'], observed=True).size().reset_index(name='Count')
+
+
+@question('attrition_by_role_overtime', "How do Job Role and Overtime status affect employee attrition?",
+          "SELECT JobRole, OverTime, "
+          "ROUND(SUM(CASE WHEN Attrition='Yes' THEN 1 ELSE 0 END)*100.0/COUNT(*),2) AS AttritionRate, "
+          "COUNT(*) AS EmployeeCount FROM employee GROUP BY JobRole, OverTime "
+          "ORDER BY AttritionRate DESC, EmployeeCount DESC;",
+          ['JobRole', 'OverTime', 'AttritionRate', 'EmployeeCount'])
+def attrition_by_role_overtime(df):
+    counts = df.groupby(['JobRole', 'OverTime'], observed=True)['Attrition'].value_counts().unstack(fill_value=0)
+    counts['EmployeeCount'] = counts.sum(axis=1)
+    counts['AttritionRate'] = (counts['Yes'] / counts['EmployeeCount'] * 100).round(2)
+    return counts.reset_index().sort_values(['AttritionRate', 'EmployeeCount'], ascending=False)
@@ -0,0 +1,103 @@
+
+# =========================
+# Bulk Employee Changes
+# =========================
+# Applies a CSV of employee changes in one go: adds/updates (upsert on EmployeeNumber),
+# MonthlyIncome updates, or deletes. The upload is validated column by column against
+# the schema (no per-row Python loop), and the valid rows are written with one
+# executemany in a single transaction that bumps the data version once, so dashboard
+# caches are invalidated once per upload rather than once per row.
+# =========================
+
+# --- Import Libraries ---
+import numpy as np
+import pandas as pd
+
+from database import EMPLOYEE_COLUMNS, bump_version, data_version, insert_employees_sql
+
+# --- Global Variables & Setup ---
+# Mode -> (required columns, description shown in the dashboard)
+BULK_MODES = {
+    'upsert': (['EmployeeNumber'], "Add or update employees (any schema columns, keyed on EmployeeNumber)"),
+    'income': (['EmployeeNumber', 'MonthlyIncome'], "Update MonthlyIncome of existing employees"),
+    'delete': (['EmployeeNumber'], "Delete employees"),
+}
+# Allowed values for the text columns the dashboard groups on.
+ALLOWED_VALUES = {
+    'Attrition': ['No', 'Yes'],
+    'OverTime': ['No', 'Yes'],
+    'Gender': ['Female', 'Male'],
+}
+
+
+def _columns_for(mode, upload):
+    required = BULK_MODES[mode][0]
+    if mode == 'upsert':
+        return [c for c in EMPLOYEE_COLUMNS if c in upload.columns]
+    return required
+
+
+def validate_upload(upload, mode):
+    # Returns (rows to apply, errors). `errors` has one row per rejected input row with
+    # its 1-based CSV line number and the reasons; rows are in schema order and typed.
+    if mode not in BULK_MODES:
+        raise ValueError(f"Unknown bulk mode: {mode}")
+    missing = [c for c in BULK_MODES[mode][0] if c not in upload.columns]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+    columns = _columns_for(mode, upload)
+    if mode == 'upsert' and len(columns) < 2:
+        raise ValueError("Upload has no employee columns besides EmployeeNumber")
+
+    rows = upload[columns].copy()
+    problems = []  # One array of messages ('' = fine) per check
+    for col in columns:
+        values = rows[col]
+        if EMPLOYEE_COLUMNS[col].startswith('INTEGER'):
+            numbers = pd.to_numeric(values, errors='coerce')
+            bad = values.notna() & (numbers.isna() | (numbers % 1 != 0))
+            problems.append(np.where(bad, f"{col} is not an integer", ''))
+            rows[col] = numbers.where(~bad).astype('Int64')
+        elif col in ALLOWED_VALUES:
+            bad = values.notna() & ~values.isin(ALLOWED_VALUES[col])
+            problems.append(np.where(bad, f"{col} must be one of {'/'.join(ALLOWED_VALUES[col])}", ''))
+
+    key = rows['EmployeeNumber']
+    problems.append(np.where(upload['EmployeeNumber'].isna(), "EmployeeNumber is missing", ''))
+    problems.append(np.where((key <= 0).fillna(False), "EmployeeNumber must be positive", ''))
+    problems.append(np.where(key.notna() & key.duplicated(keep=False), "EmployeeNumber appears more than once", ''))
+    if mode == 'income':
+        problems.append(np.where(upload['MonthlyIncome'].isna(), "MonthlyIncome is missing", ''))
+        problems.append(np.where((rows['MonthlyIncome'] < 0).fillna(False), "MonthlyIncome must not be negative", ''))
+
+    reasons = pd.Series('', index=upload.index, dtype=object)
+    for messages in problems:
+        reasons = reasons.where(messages == '', reasons + '; ' + messages)
+    reasons = reasons.str.removeprefix('; ')
+    invalid = (reasons != '').to_numpy()
+    errors = pd.DataFrame({'Line': upload.index[invalid] + 2, 'Reason': reasons[invalid]})  # +1 header, +1 1-based
+    return rows[~invalid].reset_index(drop=True), errors.reset_index(drop=True)
+
+
+def _records(rows):
+    # Plain Python values for sqlite3 (NULL for missing), generated lazily for executemany.
+    return rows.astype(object).where(rows.notna(), None).itertuples(index=False, name=None)
+
+
+def apply_upload(conn, rows, mode):
+    # One transaction, one executemany, one version bump. Returns (rows affected, data version).
+    if rows.empty:
+        return 0, data_version(conn)
+    with conn:
+        if mode == 'upsert':
+            cursor = conn.executemany(insert_employees_sql(list(rows.columns)), _records(rows))
+        elif mode == 'income':
+            cursor = conn.executemany(
+                "UPDATE employee SET MonthlyIncome = ? WHERE EmployeeNumber = ?",
+                _records(rows[['MonthlyIncome', 'EmployeeNumber']]),
+            )
+        else:
+            cursor = conn.executemany("DELETE FROM employee WHERE EmployeeNumber = ?", _records(rows[['EmployeeNumber']]))
+        if cursor.rowcount == 0:
+            return 0, data_version(conn)
+        return cursor.rowcount, bump_version(conn, ['MonthlyIncome'] if mode == 'income' else None)
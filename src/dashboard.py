@@ -13,12 +13,18 @@ import sqlite3
 import streamlit as st
 import plotly.express as px  
 import plotly.graph_objects as go 
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import classification_report, accuracy_score, confusion_matrix
-import seaborn as sns
-import matplotlib.pyplot as plt
+from bulk import BULK_MODES, apply_upload, validate_upload
+from database import CSV_PATH, DB_NAME, EMPLOYEE_COLUMNS, ConnectionPool, columns_version, data_version, delete_employee, insert_employee, update_monthly_income
+from figure_cache import FigureCache
+from filters import EmployeeFilter, FilterCountCache, column_bounds, filtered_summary
+from frame_cache import load_employee_frame_cached
+from frames import append_employees, drop_employees, set_monthly_income
+from ingest import ensure_employee_table
+from metrics import load_summary, metrics_from_summary
+from model import BackgroundTrainer, TrainingConfig, frame_hash, prepare_training_frame
+from pagination import KEY_COLUMN, PAGE_SIZES, PageRequest, fetch_page, page_count
+from perf import PERF_LOG, PerfRecorder, summarize
+from snapshot import EmployeeStore
 
 # --- Streamlit Page Configuration ---
 # Set up the Streamlit page with a wide layout, custom title, and sidebar menu links.
@@ -303,48 +309,240 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 # --- Global Variables & Setup ---
-DB_NAME = 'data/hr.db'  # SQLite database file
-CSV_PATH = 'data/WA_Fn-UseC_-HR-Employee-Attrition.csv'  # Source CSV for initial data
+# DB_NAME (SQLite database file) and CSV_PATH (source CSV for initial data) live in database.py.
+
+# --- Database Connections (Cached) ---
+# One connection pool per process (see database.ConnectionPool): reads check a read-only
+# connection out of the pool for the duration of a `with` block, and all commits go through
+# the single writer. The connections are closed when the cached pool is released.
+@st.cache_resource(on_release=lambda pool: pool.close())
+def get_connection_pool():
+    return ConnectionPool(DB_NAME)
+
+def read_connection():
+    # `with read_connection() as conn:` for one read-only pooled connection.
+    return get_connection_pool().reader()
+
+# --- Employee Data (Shared Snapshot) ---
+# Makes sure the SQLite table is populated (the CSV is only re-ingested when it changed,
+# so edits made through the management forms survive restarts). The compact employee frame
+# (categoricals, narrow ints, no constant columns) is held once per process in an
+# EmployeeStore and shared read-only by all sessions; see snapshot.py. Cold starts read it
+# from the memory-mapped columnar cache when that matches the database (frame_cache.py).
+@st.cache_resource
+def get_employee_store():
+    with get_connection_pool().writer() as writer:
+        ensure_employee_table(writer, CSV_PATH)
+    return EmployeeStore(loader=load_employee_frame_cached)
+
+# --- Attrition Model Trainer (Cached) ---
+# One background trainer shared by all sessions. It serves the last finished model
+# (loaded from disk when available) while a refit for changed data runs in the background.
+# Fits use every core, and refits after new rows only grow fresh trees (warm start).
+TRAINING_CONFIG = TrainingConfig(n_estimators=200, random_state=42, n_jobs=-1, warm_start=True)
 
-# --- Database Connection (Cached) ---
-# Use Streamlit's resource cache to persist the SQLite connection across reruns.
 @st.cache_resource
-def get_connection():
-    return sqlite3.connect(DB_NAME , check_same_thread=False)
+def get_model_trainer():
+    return BackgroundTrainer(TRAINING_CONFIG)
 
-# --- Data Loading (Cached) ---
-# Loads data from CSV, ensures the SQLite table is populated, and returns a DataFrame.
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv(CSV_PATH)
-        # Ensure 'hr.db' exists and 'employee' table is populated
-        conn = get_connection() # Get connection from cache
-        df.to_sql('employee', conn, if_exists='replace', index=False)
-        # No need to close conn here as it's a cached resource
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {e}. Please ensure '{CSV_PATH}' is in the same directory.")
-        return pd.DataFrame() # Return empty DataFrame on error
+# --- Performance Instrumentation ---
+# Sections are timed (wall time, rows, memory delta) only in sessions that tick "Record
+# section timings" in the sidebar Performance panel; otherwise timed_section() is a no-op.
+# Timings of all sessions are collected by one recorder and appended to PERF_LOG (perf.py).
+@st.cache_resource
+def get_perf_recorder():
+    return PerfRecorder(PERF_LOG)
+
+def timed_section(name, rows=None):
+    return get_perf_recorder().section(name, enabled=st.session_state.get('perf_enabled', False), rows=rows)
 
 # --- Load Data ---
-df = load_data()
-if df.empty:
+# Every session reads the same snapshot; session state only records which version it saw.
+try:
+    with timed_section('load_employees') as span:
+        with read_connection() as conn:
+            snapshot = get_employee_store().current(conn)
+        span.rows = len(snapshot.frame)
+except Exception as e:
+    st.error(f"Error loading data: {e}. Please ensure '{CSV_PATH}' is in the same directory.")
     st.stop() # Stop if data loading failed
+df, memory_report = snapshot.frame, snapshot.memory_report
+if df.empty:
+    st.stop() # Stop if there is no data
+st.session_state.employees_version = snapshot.version
+
+# --- Helper: Apply a Committed Change ---
+# Publishes the write to the shared snapshot by patching a copy-on-write frame instead of
+# re-reading the whole table (the store reloads if another session wrote in between),
+# then reruns the page so all sections pick the change up.
+def apply_employee_change(new_version, patch):
+    with read_connection() as conn:
+        snapshot = get_employee_store().apply(conn, new_version, patch)
+    st.session_state.employees_version = snapshot.version
+    st.rerun()
+
+# --- Dashboard Metrics (Cached per Data Version and Filter) ---
+# The summary table is maintained by triggers on every write; all KPIs and chart breakdowns
+# are computed from it in one pass, and only again when the data or the filter changed.
+# A filtered slice is aggregated by SQLite into the same grouped shape (see filters.py).
+@st.cache_data(max_entries=64)
+def get_metrics(version, employee_filter=EmployeeFilter()):
+    with read_connection() as conn:
+        if employee_filter.is_empty():
+            return metrics_from_summary(load_summary(conn))
+        return metrics_from_summary(filtered_summary(conn, employee_filter))
 
-# --- SQL Cursor Setup ---
-conn = get_connection()
-cursor = conn.cursor()
+@st.cache_data
+def get_filter_bounds(version):
+    with read_connection() as conn:
+        return column_bounds(conn, ['Age', 'MonthlyIncome'])
 
-# --- Session State Initialization ---
-# Store employee DataFrame in session state for interactive operations (add/update/delete).
-if 'employees_df' not in st.session_state:
-    st.session_state.employees_df = pd.read_sql("SELECT * FROM employee", conn)
+@st.cache_resource
+def get_filter_counts():
+    return FilterCountCache()
+
+# --- Sidebar Performance Panel ---
+# The timing summary is filled in at the end of the run (see the bottom of this script).
+with st.sidebar.expander("Performance", expanded=False):
+    st.checkbox("Record section timings", key='perf_enabled')
+    perf_panel = st.empty()
+
+# --- Helper: Range Slider With Moving Bounds ---
+# A write can move a column's min/max, which changes the slider's identity and would reset
+# it to the full range. Instead, the range chosen before is clamped to the new bounds and
+# seeded into the widget's state; a range spanning the old bounds (no filter) spans the new ones.
+def range_slider(label, bounds, key, **kwargs):
+    last_bounds = st.session_state.get(f'{key}_bounds')
+    if key in st.session_state and last_bounds is not None and last_bounds != bounds:
+        low, high = st.session_state[key]
+        if (low, high) == last_bounds:
+            low, high = bounds
+        low = min(max(low, bounds[0]), bounds[1])
+        high = max(min(high, bounds[1]), low)
+        st.session_state[key] = (low, high)
+    elif key not in st.session_state:
+        st.session_state[key] = bounds
+    st.session_state[f'{key}_bounds'] = bounds
+    return tuple(st.slider(label, *bounds, key=key, **kwargs))
+
+# --- Sidebar Filter Panel ---
+# One filter for the whole page: KPI cards, charts and the filtered grid all show the slice.
+with timed_section('filter_options'):
+    all_metrics = get_metrics(st.session_state.employees_version)
+with st.sidebar.expander("Filters", expanded=False):
+    filter_departments = st.multiselect("Department", list(all_metrics.department_counts['Department']), key='filter_departments')
+    filter_roles = st.multiselect("Job Role", list(all_metrics.average_income_by_role['JobRole']), key='filter_job_roles')
+    filter_overtime = st.multiselect("OverTime", ['No', 'Yes'], key='filter_overtime')
+    filter_attrition = st.multiselect("Attrition", ['No', 'Yes'], key='filter_attrition')
+    bounds = get_filter_bounds(st.session_state.employees_version)
+    age_bounds = tuple(int(v) for v in bounds['Age'])
+    income_bounds = tuple(int(v) for v in bounds['MonthlyIncome'])
+    filter_age = range_slider("Age", age_bounds, 'filter_age')
+    filter_income = range_slider("Monthly Income", income_bounds, 'filter_income', step=100)
+
+# Ranges spanning the whole table are no condition (keeps the summary-table fast path).
+active_filter = EmployeeFilter(
+    departments=tuple(filter_departments),
+    job_roles=tuple(filter_roles),
+    overtime=tuple(filter_overtime),
+    attrition=tuple(filter_attrition),
+    age=None if tuple(filter_age) == age_bounds else tuple(filter_age),
+    monthly_income=None if tuple(filter_income) == income_bounds else tuple(filter_income),
+)
 
-# --- Helper: Refresh Employee Data ---
-def refresh_employees_df():
-    # Reload employee data from the database into session state.
-    st.session_state.employees_df = pd.read_sql("SELECT * FROM employee", get_connection())
+# --- Section Dependencies ---
+# The employee columns each dashboard section is computed from. A section's results are
+# cached under the latest version of those columns plus the filtered ones (see
+# database.columns_version), so a write only recomputes the sections that read what it
+# changed: an income update leaves e.g. the department and treemap charts untouched.
+# Adding or deleting employees changes every column.
+SECTION_DEPENDENCIES = {
+    'kpis': ['Attrition', 'MonthlyIncome'],
+    'department_chart': ['Department'],
+    'income_by_role_chart': ['JobRole', 'MonthlyIncome'],
+    'attrition_treemap': ['Department', 'JobRole', 'Attrition'],
+    'performance_attrition_chart': ['PerformanceRating', 'Attrition'],
+    'overtime_attrition_chart': ['JobRole', 'OverTime', 'Attrition'],
+    'income_attrition_chart': ['Attrition', 'MonthlyIncome'],
+    'top_performers': ['PerformanceRating', 'Department', 'JobRole', 'MonthlyIncome'],
+    'best_department': ['Department', 'PerformanceRating'],
+}
+
+def section_version(section, employee_filter):
+    columns = set(SECTION_DEPENDENCIES[section]) | set(employee_filter.columns())
+    with read_connection() as conn:
+        return columns_version(conn, sorted(columns))
+
+@st.cache_data(max_entries=256)
+def get_section_metrics(section, version, employee_filter):
+    # `version` only keys the cache: unchanged dependencies return the earlier result.
+    with read_connection() as conn:
+        version = data_version(conn)
+    return get_metrics(version, employee_filter)
+
+def section_metrics(section, employee_filter):
+    return get_section_metrics(section, section_version(section, employee_filter), employee_filter)
+
+# --- Figure Cache ---
+# Built figures are kept as JSON in one process-wide LRU (see figure_cache.py), keyed by
+# figure id, the section's data version and the active filter; an unchanged dashboard
+# re-renders every chart from the cached payload.
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(maxsize=128)
+
+def cached_chart(section, employee_filter, build):
+    with timed_section(section):
+        key = (section, section_version(section, employee_filter), employee_filter)
+        st.plotly_chart(get_figure_cache().get_or_build(key, build), use_container_width=True)
+
+# --- Helper: Messages That Survive a Rerun ---
+# Management actions rerun the whole page after a write so every section shows the new
+# data; their confirmations are queued here and shown on that rerun.
+def flash(kind, message):
+    st.session_state.setdefault('flash_messages', []).append((kind, message))
+
+def show_flash_messages():
+    for kind, message in st.session_state.pop('flash_messages', []):
+        getattr(st, kind)(message)
+
+# --- Paginated Employee Grid ---
+# Grids page, sort and filter in SQLite; only the visible page is read and serialized.
+# Pages are cached per data version, and moving to the next page of an EmployeeNumber
+# sort continues from the previous page's last key (keyset) instead of an OFFSET scan.
+@st.cache_data(max_entries=128)
+def get_page(version, request, after=None):
+    with read_connection() as conn:
+        return fetch_page(conn, request, after=after)
+
+def paginated_grid(key, employee_filter=EmployeeFilter()):
+    version = st.session_state.employees_version
+    with read_connection() as conn:
+        total = get_filter_counts().count(conn, version, employee_filter)
+    where, params = employee_filter.to_sql()
+    sort_col, order_col, size_col, page_col = st.columns([2, 1, 1, 1])
+    sort_by = sort_col.selectbox("Sort by", list(EMPLOYEE_COLUMNS), index=list(EMPLOYEE_COLUMNS).index(KEY_COLUMN), key=f'{key}_sort')
+    descending = order_col.selectbox("Order", ["Ascending", "Descending"], key=f'{key}_order') == "Descending"
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, index=1, key=f'{key}_page_size')
+    pages = page_count(total, page_size)
+    page = min(int(page_col.number_input(f"Page (of {pages})", min_value=1, step=1, key=f'{key}_page')), pages)
+
+    request = PageRequest(page, page_size, sort_by, descending, where, params)
+    # Keyset cursor: (signature, version, page, last EmployeeNumber) of the page shown last time.
+    cursor = st.session_state.get(f'{key}_cursor')
+    after = None
+    if cursor and cursor[:2] == (request.signature(), version) and cursor[2] + 1 == page:
+        after = cursor[3]
+    with timed_section(f'{key}_query') as span:
+        page_df = get_page(version, request, after)
+        span.rows = len(page_df)
+    if not page_df.empty:
+        st.session_state[f'{key}_cursor'] = (request.signature(), version, page, int(page_df[KEY_COLUMN].iloc[-1]))
+
+    with timed_section(f'{key}_render', rows=len(page_df)):
+        st.dataframe(page_df, use_container_width=True, hide_index=True)
+    first_row = request.offset + 1 if total else 0
+    st.caption(f"Rows {first_row:,}–{request.offset + len(page_df):,} of {total:,}")
 
 # --- Sidebar Navigation ---
 # Use expanders for logical grouping of dashboard navigation links.
@@ -373,23 +571,26 @@ st.markdown("## Key HR Metrics")
 
 col1, col2, col3, col4 = st.columns(4)
 
+# All KPI cards and charts below read the precomputed metrics of their section.
+with timed_section('kpis') as span:
+    kpi_metrics = section_metrics('kpis', active_filter)
+    span.rows = kpi_metrics.total_employees
+
 # --- Metric 1: Employees Who Have Not Left ---
-query_not_left = "SELECT COUNT(*) FROM employee WHERE Attrition = 'No';"
-cursor.execute(query_not_left)
-not_left_count = cursor.fetchone()[0]
+not_left_count = kpi_metrics.not_left_count
 col1.metric("Employees Still With Company", not_left_count, "No Attrition")
 
 # --- Metric 2: Total Employees ---
-total_employees = df.shape[0]
+total_employees = kpi_metrics.total_employees
 col2.metric("Total Employees", total_employees)
 
 # --- Metric 3: Attrition Rate ---
-attrition_count = df[df['Attrition'] == 'Yes'].shape[0]
-attrition_rate = (attrition_count / total_employees) * 100 if total_employees > 0 else 0
+attrition_count = kpi_metrics.attrition_count
+attrition_rate = kpi_metrics.attrition_rate
 col3.metric("Overall Attrition Rate", f"{attrition_rate:.2f}%", delta=f"{attrition_count} employees left", delta_color="inverse")
 
 # --- Metric 4: Average Monthly Income ---
-avg_monthly_income_overall = df['MonthlyIncome'].mean()
+avg_monthly_income_overall = kpi_metrics.avg_monthly_income
 col4.metric("Avg. Monthly Income (Overall)", f"${avg_monthly_income_overall:,.2f}")
 
 st.markdown("---")
@@ -403,37 +604,35 @@ col_dept_chart, col_job_chart = st.columns(2)
 
 with col_dept_chart:
     # --- Bar Chart: Employee Count by Department ---
-    query_dept_counts = "SELECT Department, COUNT(*) FROM employee GROUP BY Department;"
-    cursor.execute(query_dept_counts)
-    dept_data = cursor.fetchall()
-    dept_df_chart = pd.DataFrame(dept_data, columns=["Department", "EmployeeCount"])
-    fig_dept = px.bar(
-        dept_df_chart, x="Department", y="EmployeeCount",
-        title="Employee Distribution Across Departments",
-        color="Department", 
-        color_discrete_map={
-            'Human Resources': STC_PURPLE_LIGHT, 
-            'Research & Development': STC_PURPLE, 
-            'Sales': STC_PURPLE_DARK
-        },
-        template="plotly_white"
-    )
-    st.plotly_chart(fig_dept, use_container_width=True)
+    def build_fig_dept():
+        dept_df_chart = section_metrics('department_chart', active_filter).department_counts
+        fig_dept = px.bar(
+            dept_df_chart, x="Department", y="EmployeeCount",
+            title="Employee Distribution Across Departments",
+            color="Department", 
+            color_discrete_map={
+                'Human Resources': STC_PURPLE_LIGHT, 
+                'Research & Development': STC_PURPLE, 
+                'Sales': STC_PURPLE_DARK
+            },
+            template="plotly_white"
+        )
+        return fig_dept
+    cached_chart('department_chart', active_filter, build_fig_dept)
 
 with col_job_chart:
     # --- Bar Chart: Average Monthly Income by Job Role ---
-    query_income_roles = "SELECT JobRole, AVG(MonthlyIncome) FROM employee GROUP BY JobRole;"
-    cursor.execute(query_income_roles)
-    income_data = cursor.fetchall()
-    income_df_chart = pd.DataFrame(income_data, columns=["JobRole", "AverageMonthlyIncome"])
-    fig_income = px.bar(
-        income_df_chart, x="JobRole", y="AverageMonthlyIncome",
-        title="Average Income Per Job Role",
-        color="AverageMonthlyIncome",
-        color_continuous_scale=CUSTOM_PURPLE_RED_GRADIENT,
-        template="plotly_white"
-    )
-    st.plotly_chart(fig_income, use_container_width=True)
+    def build_fig_income():
+        income_df_chart = section_metrics('income_by_role_chart', active_filter).average_income_by_role
+        fig_income = px.bar(
+            income_df_chart, x="JobRole", y="AverageMonthlyIncome",
+            title="Average Income Per Job Role",
+            color="AverageMonthlyIncome",
+            color_continuous_scale=CUSTOM_PURPLE_RED_GRADIENT,
+            template="plotly_white"
+        )
+        return fig_income
+    cached_chart('income_by_role_chart', active_filter, build_fig_income)
 
 # =========================
 # SECTION: Attrition Insights
@@ -444,41 +643,35 @@ col_attrition_rate, col_perf_attrition = st.columns(2)
 
 with col_attrition_rate:
     # --- Treemap: Attrition Rate by Department & Job Role ---
-    attrition_counts = df.groupby(['Department', 'JobRole'])['Attrition'].value_counts().unstack().fillna(0)
-    if 'Yes' not in attrition_counts.columns:
-        attrition_counts['Yes'] = 0
-    attrition_rate_calc = (attrition_counts['Yes'] / attrition_counts.sum(axis=1) * 100).round(2)
-    attrition_rate_df_display = attrition_rate_calc.reset_index().rename(columns={0: 'AttritionRate'})
-    # Add employee count for better context in treemap
-    total_employees_per_group = df.groupby(['Department', 'JobRole']).size().reset_index(name='TotalEmployees')
-    attrition_rate_df_display = pd.merge(attrition_rate_df_display, total_employees_per_group, on=['Department', 'JobRole'])
-    fig_attrition_rate = px.treemap(
-        attrition_rate_df_display, path=['Department', 'JobRole'], values='TotalEmployees',
-        color='AttritionRate', hover_data=['AttritionRate', 'TotalEmployees'],
-        title='Attrition Rate by Department & Job Role',
-        color_continuous_scale=CUSTOM_PURPLE_RED_GRADIENT, 
-        template="plotly_white"
-    )
-    st.plotly_chart(fig_attrition_rate, use_container_width=True)
+    # Includes the employee count per group for better context in the treemap
+    def build_fig_attrition_rate():
+        attrition_rate_df_display = section_metrics('attrition_treemap', active_filter).attrition_by_department_role
+        fig_attrition_rate = px.treemap(
+            attrition_rate_df_display, path=['Department', 'JobRole'], values='TotalEmployees',
+            color='AttritionRate', hover_data=['AttritionRate', 'TotalEmployees'],
+            title='Attrition Rate by Department & Job Role',
+            color_continuous_scale=CUSTOM_PURPLE_RED_GRADIENT, 
+            template="plotly_white"
+        )
+        return fig_attrition_rate
+    cached_chart('attrition_treemap', active_filter, build_fig_attrition_rate)
 
 with col_perf_attrition:
     # --- Grouped Bar: Performance Rating vs Attrition ---
-    perf_attrition_data = df.groupby(['PerformanceRating', 'Attrition']).size().unstack(fill_value=0).reset_index()
-    if 'Yes' not in perf_attrition_data.columns:
-        perf_attrition_data['Yes'] = 0
-    if 'No' not in perf_attrition_data.columns:
-        perf_attrition_data['No'] = 0
-    fig_perf_attrition = go.Figure(data=[
-        go.Bar(name='No Attrition', x=perf_attrition_data['PerformanceRating'], y=perf_attrition_data['No'], marker_color=STC_PURPLE_LIGHT),
-        go.Bar(name='Yes Attrition', x=perf_attrition_data['PerformanceRating'], y=perf_attrition_data['Yes'], marker_color=STC_PURPLE_DARK)
-    ])
-    fig_perf_attrition.update_layout(
-        barmode='group',
-        title='Employee Count by Performance Rating and Attrition',
-        xaxis_title="Performance Rating", yaxis_title="Number of Employees",
-        template="plotly_white"
-    )
-    st.plotly_chart(fig_perf_attrition, use_container_width=True)
+    def build_fig_perf_attrition():
+        perf_attrition_data = section_metrics('performance_attrition_chart', active_filter).performance_vs_attrition
+        fig_perf_attrition = go.Figure(data=[
+            go.Bar(name='No Attrition', x=perf_attrition_data['PerformanceRating'], y=perf_attrition_data['No'], marker_color=STC_PURPLE_LIGHT),
+            go.Bar(name='Yes Attrition', x=perf_attrition_data['PerformanceRating'], y=perf_attrition_data['Yes'], marker_color=STC_PURPLE_DARK)
+        ])
+        fig_perf_attrition.update_layout(
+            barmode='group',
+            title='Employee Count by Performance Rating and Attrition',
+            xaxis_title="Performance Rating", yaxis_title="Number of Employees",
+            template="plotly_white"
+        )
+        return fig_perf_attrition
+    cached_chart('performance_attrition_chart', active_filter, build_fig_perf_attrition)
 
 # =========================
 # SECTION: Detailed Analysis - Overtime & Income Impact
@@ -489,43 +682,38 @@ col_ot_attrition, col_income_attrition = st.columns(2)
 
 with col_ot_attrition:
     # --- Grouped Bar: Attrition Rate by Job Role and Overtime ---
-    job_ot_attrition = (
-        df.groupby(['JobRole', 'OverTime'])['Attrition']
-          .value_counts()
-          .unstack(fill_value=0)
-    )
-    job_ot_attrition['EmployeeCount'] = job_ot_attrition.sum(axis=1)
-    if 'Yes' not in job_ot_attrition.columns:
-        job_ot_attrition['Yes'] = 0
-    job_ot_attrition['AttritionRate'] = (job_ot_attrition['Yes'] / job_ot_attrition['EmployeeCount'] * 100).round(2)
-    job_ot_attrition = job_ot_attrition.reset_index()
-    fig_ot_attrition = px.bar(
-        job_ot_attrition.sort_values('AttritionRate', ascending=False),
-        x='JobRole',
-        y='AttritionRate',
-        color='OverTime',
-        barmode='group',
-        text='AttritionRate',
-        title='Attrition Rate by Job Role and Overtime',
-        color_discrete_map={'Yes': STC_PURPLE_DARK, 'No': STC_PURPLE_LIGHT},
-        template="plotly_white",
-        height=500
-    )  
-    fig_ot_attrition.update_traces(texttemplate='%{text:.2s}%', textposition='outside')
-    fig_ot_attrition.update_layout(uniformtext_minsize=8, uniformtext_mode='hide')
-    st.plotly_chart(fig_ot_attrition, use_container_width=True)
+    def build_fig_ot_attrition():
+        job_ot_attrition = section_metrics('overtime_attrition_chart', active_filter).attrition_by_role_overtime
+        fig_ot_attrition = px.bar(
+            job_ot_attrition.sort_values('AttritionRate', ascending=False),
+            x='JobRole',
+            y='AttritionRate',
+            color='OverTime',
+            barmode='group',
+            text='AttritionRate',
+            title='Attrition Rate by Job Role and Overtime',
+            color_discrete_map={'Yes': STC_PURPLE_DARK, 'No': STC_PURPLE_LIGHT},
+            template="plotly_white",
+            height=500
+        )  
+        fig_ot_attrition.update_traces(texttemplate='%{text:.2s}%', textposition='outside')
+        fig_ot_attrition.update_layout(uniformtext_minsize=8, uniformtext_mode='hide')
+        return fig_ot_attrition
+    cached_chart('overtime_attrition_chart', active_filter, build_fig_ot_attrition)
 
 with col_income_attrition:
     # --- Bar: Average Monthly Income by Attrition Status ---
-    income_by_attrition = df.groupby('Attrition')['MonthlyIncome'].mean().reset_index()
-    fig_income_corr = px.bar(
-        income_by_attrition, x='Attrition', y='MonthlyIncome',
-        color='Attrition',
-        title='Average Monthly Income by Attrition Status',
-        color_discrete_map={'Yes': STC_PURPLE_DARK, 'No': STC_PURPLE_LIGHT},
-        template="plotly_white"
-    )
-    st.plotly_chart(fig_income_corr, use_container_width=True)
+    def build_fig_income_corr():
+        income_by_attrition = section_metrics('income_attrition_chart', active_filter).income_by_attrition
+        fig_income_corr = px.bar(
+            income_by_attrition, x='Attrition', y='MonthlyIncome',
+            color='Attrition',
+            title='Average Monthly Income by Attrition Status',
+            color_discrete_map={'Yes': STC_PURPLE_DARK, 'No': STC_PURPLE_LIGHT},
+            template="plotly_white"
+        )
+        return fig_income_corr
+    cached_chart('income_attrition_chart', active_filter, build_fig_income_corr)
 
 st.markdown("---")
 
@@ -534,28 +722,46 @@ st.markdown("---")
 # =========================
 st.markdown("## Detailed Data Views")
 
-with st.expander("View All Employee Data", expanded=False):
-    st.dataframe(df)
-
-with st.expander("Top 5 Employees by Performance Rating", expanded=False):
-    # --- Table: Top 5 Employees by Performance ---
-    query_top5_perf = "SELECT EmployeeNumber, PerformanceRating, Department, JobRole, MonthlyIncome FROM employee ORDER BY PerformanceRating DESC LIMIT 5;"
-    cursor.execute(query_top5_perf)
-    top5_perf_data = cursor.fetchall()
-    top5_perf_df = pd.DataFrame(top5_perf_data, columns=["EmployeeNumber", "PerformanceRating", "Department", "JobRole", "MonthlyIncome"])
-    st.table(top5_perf_df)
-
-with st.expander("Department with Highest Average Performance Rating", expanded=False):
-    # --- Info: Department with Best Performance ---
-    query_best_dept_perf = """
-    SELECT Department, AVG(PerformanceRating) as AvgPerformanceRating
-    FROM employee GROUP BY Department ORDER BY AvgPerformanceRating DESC LIMIT 1;"""
-    cursor.execute(query_best_dept_perf)
-    best_dept_perf_result = cursor.fetchone()
-    if best_dept_perf_result:
-        st.info(f"The department with the highest average performance rating is **{best_dept_perf_result[0]}** with an average of **{best_dept_perf_result[1]:.2f}**.")
-    else:
-        st.write("No data available for average performance rating by department.")
+# Grid paging/sorting only reruns this fragment, not the whole page.
+@st.cache_data(max_entries=64)
+def get_top_performers(version, employee_filter):
+    filter_where, filter_params = employee_filter.to_sql()
+    query_top5_perf = (
+        "SELECT EmployeeNumber, PerformanceRating, Department, JobRole, MonthlyIncome FROM employee"
+        + (f" WHERE {filter_where}" if filter_where else "")
+        + " ORDER BY PerformanceRating DESC LIMIT 5;"
+    )
+    with read_connection() as conn:
+        top5_perf_data = conn.execute(query_top5_perf, filter_params).fetchall()
+    return pd.DataFrame(top5_perf_data, columns=["EmployeeNumber", "PerformanceRating", "Department", "JobRole", "MonthlyIncome"])
+
+@st.fragment
+def detailed_data_views(employee_filter):
+    with st.expander("View All Employee Data", expanded=False):
+        if memory_report:
+            st.caption(
+                f"In-memory size: {memory_report['after_bytes'] / 1e6:.2f} MB "
+                f"({memory_report['before_bytes'] / 1e6:.2f} MB before dtype optimization)"
+            )
+        paginated_grid('all_employees')
+
+    with st.expander("Top 5 Employees by Performance Rating", expanded=False):
+        # --- Table: Top 5 Employees by Performance ---
+        with timed_section('top_performers') as span:
+            top5_perf_df = get_top_performers(section_version('top_performers', employee_filter), employee_filter)
+            st.table(top5_perf_df)
+            span.rows = len(top5_perf_df)
+
+    with st.expander("Department with Highest Average Performance Rating", expanded=False):
+        # --- Info: Department with Best Performance ---
+        with timed_section('best_department'):
+            best_dept_perf_result = section_metrics('best_department', employee_filter).best_department
+        if best_dept_perf_result:
+            st.info(f"The department with the highest average performance rating is **{best_dept_perf_result[0]}** with an average of **{best_dept_perf_result[1]:.2f}**.")
+        else:
+            st.write("No data available for average performance rating by department.")
+
+detailed_data_views(active_filter)
 
 st.markdown("---")
 
@@ -564,14 +770,17 @@ st.markdown("---")
 # =========================
 st.markdown("## Interactive Employee Filter")
 
-departments = df['Department'].unique()
-selected_dept_filter = st.selectbox("Select Department to Filter", ['All'] + list(departments), key='filter_dept_selectbox')
-
-filtered_df = st.session_state.employees_df.copy() # Use session state for filtering
-if selected_dept_filter != 'All':
-    filtered_df = filtered_df[filtered_df['Department'] == selected_dept_filter]
+# Shows the slice selected in the sidebar "Filters" panel. The filter runs in SQLite as part
+# of the paginated query; only the visible page is loaded, and paging reruns this fragment only.
+@st.fragment
+def filtered_employees(employee_filter):
+    if employee_filter.is_empty():
+        st.caption("No filter active: use the Filters panel in the sidebar to narrow down the employees.")
+    else:
+        st.caption("Filtered on " + ", ".join(employee_filter.columns()) + ".")
+    paginated_grid('filtered_employees', employee_filter)
 
-st.dataframe(filtered_df, use_container_width=True)
+filtered_employees(active_filter)
 
 st.markdown("---")
 
@@ -580,108 +789,144 @@ st.markdown("---")
 # =========================
 st.markdown("## Employee Management Actions")
 
-# --- Two Columns: Add Employee | Update/Delete Employee ---
-col_add_employee, col_update_delete = st.columns([1, 1])
-
-with col_add_employee:
-    # --- Add New Employee Form ---
-    st.subheader("Add New Employee")
-    with st.form("add_employee_form"):
-        try:
-            # Determine next available employee number
-            if not st.session_state.employees_df.empty:
-                max_emp_num = st.session_state.employees_df['EmployeeNumber'].max()
-                next_emp_num = max_emp_num + 1 if max_emp_num else 1
-            else:
-                next_emp_num = 1
-        except Exception:
-            next_emp_num = 1
+# Form submits rerun only this fragment; a successful write then reruns the page once.
+@st.fragment
+def employee_management():
+    show_flash_messages()
 
-        emp_num = st.number_input("Employee Number", min_value=1, step=1, value=int(next_emp_num), key='add_emp_num')
-        age = st.number_input("Age", min_value=18, max_value=100, step=1, value=30, key='add_age')
-        gender = st.selectbox("Gender", ["Male", "Female"], key='add_gender')
-        
-        # Provide options for department and job role, fallback to defaults if empty
-        dept_options = ['Sales', 'Research & Development', 'Human Resources'] if st.session_state.employees_df.empty else st.session_state.employees_df['Department'].unique()
-        job_role_options = [
-            'Sales Executive', 'Research Scientist', 'Laboratory Technician', 'Manufacturing Director',
-            'Healthcare Representative', 'Manager', 'Sales Representative', 'Research Director', 'Human Resources'
-        ] if st.session_state.employees_df.empty else st.session_state.employees_df['JobRole'].unique()
-
-        department = st.selectbox("Department", dept_options, key='add_dept')
-        job_role = st.selectbox("Job Role", job_role_options, key='add_job_role')
-        monthly_income = st.number_input("Monthly Income", min_value=0, step=100, value=5000, key='add_monthly_income')
-        # Uncomment below to add more fields (Performance, Attrition, OverTime)
-        # performance_rating = st.selectbox("Performance Rating", [1, 2, 3, 4], index=1, key='add_perf')
-        # attrition = st.selectbox("Attrition", ["No", "Yes"], key='add_attrition')
-        # overtime_status = st.selectbox("OverTime", ["No", "Yes"], key='add_overtime')
-        submit_btn = st.form_submit_button("Add Employee", type="primary")
-
-        if submit_btn:
-            insert_query = """
-                INSERT INTO employee (EmployeeNumber, Age, Gender, Department, JobRole, MonthlyIncome)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """
-            try:
-                conn_manage = get_connection()
-                cursor_manage = conn_manage.cursor()
-                cursor_manage.execute(insert_query, (
-                    int(emp_num), int(age), gender, department, job_role, int(monthly_income)
-                ))
-                conn_manage.commit()
-                refresh_employees_df()
-                st.success(f"New employee {emp_num} added successfully!")
-            except sqlite3.IntegrityError:
-                st.error(f"Error: Employee Number {emp_num} already exists. Please choose a unique number.")
-            except Exception as e:
-                st.error(f"Error adding employee: {e}")
-
-with col_update_delete: 
-    # --- Update Employee Income Form ---
-    st.subheader("Update Employee Monthly Income")
-    with st.form("update_income_form"):
-        emp_num_update = st.number_input("Enter Employee Number to Update", min_value=1, step=1, key='update_emp_num')
-        new_income = st.number_input("New Monthly Income", min_value=0, step=100, key='new_income_val')
-        update_btn = st.form_submit_button("Update Income", type="secondary")
-        if update_btn:
-            update_query = "UPDATE employee SET MonthlyIncome = ? WHERE EmployeeNumber = ?"
+    # --- Two Columns: Add Employee | Update/Delete Employee ---
+    col_add_employee, col_update_delete = st.columns([1, 1])
+
+    with col_add_employee:
+        # --- Add New Employee Form ---
+        st.subheader("Add New Employee")
+        with st.form("add_employee_form"):
             try:
-                conn_manage = get_connection()
-                cursor_manage = conn_manage.cursor()
-                cursor_manage.execute(update_query, (int(new_income), int(emp_num_update)))
-                conn_manage.commit()
-                if cursor_manage.rowcount > 0:
-                    st.success(f"Employee #{emp_num_update}'s income updated to {new_income:,.2f}.")
-                    refresh_employees_df()
+                # Determine next available employee number
+                if not df.empty:
+                    max_emp_num = df['EmployeeNumber'].max()
+                    next_emp_num = max_emp_num + 1 if max_emp_num else 1
                 else:
-                    st.warning(f"Employee number {emp_num_update} not found.")
-            except Exception as e:
-                st.error(f"Error updating income: {e}")
-
-    st.markdown("---")
-    # --- Delete Employee Form ---
-    st.subheader("Delete Employee")
-    with st.form("delete_employee_form"):
-        emp_num_delete = st.number_input("Enter Employee Number to Delete", min_value=1, step=1, key='delete_emp_num')
-        delete_btn = st.form_submit_button("Delete Employee", type="secondary", key="red")
-        if delete_btn:
-            delete_query = "DELETE FROM employee WHERE EmployeeNumber = ?"
+                    next_emp_num = 1
+            except Exception:
+                next_emp_num = 1
+
+            emp_num = st.number_input("Employee Number", min_value=1, step=1, value=int(next_emp_num), key='add_emp_num')
+            age = st.number_input("Age", min_value=18, max_value=100, step=1, value=30, key='add_age')
+            gender = st.selectbox("Gender", ["Male", "Female"], key='add_gender')
+        
+            # Provide options for department and job role, fallback to defaults if empty
+            dept_options = ['Sales', 'Research & Development', 'Human Resources'] if df.empty else df['Department'].unique()
+            job_role_options = [
+                'Sales Executive', 'Research Scientist', 'Laboratory Technician', 'Manufacturing Director',
+                'Healthcare Representative', 'Manager', 'Sales Representative', 'Research Director', 'Human Resources'
+            ] if df.empty else df['JobRole'].unique()
+
+            department = st.selectbox("Department", dept_options, key='add_dept')
+            job_role = st.selectbox("Job Role", job_role_options, key='add_job_role')
+            monthly_income = st.number_input("Monthly Income", min_value=0, step=100, value=5000, key='add_monthly_income')
+            # Uncomment below to add more fields (Performance, Attrition, OverTime)
+            # performance_rating = st.selectbox("Performance Rating", [1, 2, 3, 4], index=1, key='add_perf')
+            # attrition = st.selectbox("Attrition", ["No", "Yes"], key='add_attrition')
+            # overtime_status = st.selectbox("OverTime", ["No", "Yes"], key='add_overtime')
+            submit_btn = st.form_submit_button("Add Employee", type="primary")
+
+            if submit_btn:
+                new_employee = {
+                    'EmployeeNumber': int(emp_num), 'Age': int(age), 'Gender': gender,
+                    'Department': department, 'JobRole': job_role, 'MonthlyIncome': int(monthly_income)
+                }
+                try:
+                    with get_connection_pool().writer() as writer:
+                        _, version = insert_employee(writer, new_employee)
+                    flash('success', f"New employee {emp_num} added successfully!")
+                    # Score the new hire with the current model (fields not on the form use typical values).
+                    current_model = get_model_trainer().current
+                    if current_model is not None:
+                        risk = current_model.predict_one(new_employee, fill_missing=True)
+                        if risk is not None:
+                            flash('info', f"Estimated attrition risk for employee {emp_num}: **{risk:.0%}**")
+                    apply_employee_change(version, lambda emp_df: append_employees(
+                        emp_df, pd.DataFrame([new_employee])
+                    ))
+                except sqlite3.IntegrityError:
+                    st.error(f"Error: Employee Number {emp_num} already exists. Please choose a unique number.")
+                except Exception as e:
+                    st.error(f"Error adding employee: {e}")
+
+    with col_update_delete: 
+        # --- Update Employee Income Form ---
+        st.subheader("Update Employee Monthly Income")
+        with st.form("update_income_form"):
+            emp_num_update = st.number_input("Enter Employee Number to Update", min_value=1, step=1, key='update_emp_num')
+            new_income = st.number_input("New Monthly Income", min_value=0, step=100, key='new_income_val')
+            update_btn = st.form_submit_button("Update Income", type="secondary")
+            if update_btn:
+                try:
+                    with get_connection_pool().writer() as writer:
+                        updated, version = update_monthly_income(writer, int(emp_num_update), int(new_income))
+                    if updated > 0:
+                        flash('success', f"Employee #{emp_num_update}'s income updated to {new_income:,.2f}.")
+                        apply_employee_change(version, lambda emp_df: set_monthly_income(
+                            emp_df, int(emp_num_update), int(new_income)
+                        ))
+                    else:
+                        st.warning(f"Employee number {emp_num_update} not found.")
+                except Exception as e:
+                    st.error(f"Error updating income: {e}")
+
+        st.markdown("---")
+        # --- Delete Employee Form ---
+        st.subheader("Delete Employee")
+        with st.form("delete_employee_form"):
+            emp_num_delete = st.number_input("Enter Employee Number to Delete", min_value=1, step=1, key='delete_emp_num')
+            delete_btn = st.form_submit_button("Delete Employee", type="secondary", key="red")
+            if delete_btn:
+                try:
+                    with get_connection_pool().writer() as writer:
+                        deleted, version = delete_employee(writer, int(emp_num_delete))
+                    if deleted > 0:
+                        flash('success', f"Employee #{emp_num_delete} deleted successfully!")
+                        apply_employee_change(version, lambda emp_df: drop_employees(
+                            emp_df, [int(emp_num_delete)]
+                        ))
+                    else:
+                        st.warning(f"Employee number {emp_num_delete} not found.")
+                except Exception as e:
+                    st.error(f"Error deleting employee: {e}")
+
+    # --- Bulk Changes from CSV ---
+    # Validated as a whole, then written in one transaction with a single version bump, so the
+    # caches below are invalidated once per upload.
+    with st.expander("Bulk Changes from CSV", expanded=False):
+        bulk_mode = st.radio("Change type", list(BULK_MODES), format_func=lambda mode: BULK_MODES[mode][1], key='bulk_mode')
+        st.caption("Required columns: " + ", ".join(BULK_MODES[bulk_mode][0]))
+        bulk_file = st.file_uploader("CSV file", type="csv", key='bulk_file')
+        if bulk_file is not None:
             try:
-                conn_manage = get_connection()
-                cursor_manage = conn_manage.cursor()
-                cursor_manage.execute(delete_query, (int(emp_num_delete),))
-                conn_manage.commit()
-                if cursor_manage.rowcount > 0:
-                    st.success(f"Employee #{emp_num_delete} deleted successfully!")
-                    refresh_employees_df()
-                else:
-                    st.warning(f"Employee number {emp_num_delete} not found.")
+                bulk_rows, bulk_errors = validate_upload(pd.read_csv(bulk_file), bulk_mode)
             except Exception as e:
-                st.error(f"Error deleting employee: {e}")
-
-# --- Display Updated Employee Table ---
-st.subheader("Current Employees")
-st.dataframe(st.session_state.employees_df, use_container_width=True)
+                st.error(f"Error reading upload: {e}")
+            else:
+                st.write(f"{len(bulk_rows):,} valid rows, {len(bulk_errors):,} rejected.")
+                if not bulk_errors.empty:
+                    st.dataframe(bulk_errors.head(100), use_container_width=True, hide_index=True)
+                if st.button(f"Apply {len(bulk_rows):,} rows", type="primary", disabled=bulk_rows.empty, key='bulk_apply'):
+                    try:
+                        with get_connection_pool().writer() as writer:
+                            affected, version = apply_upload(writer, bulk_rows, bulk_mode)
+                        flash('success', f"Bulk change applied: {affected:,} employee rows affected.")
+                        if affected > 0:
+                            apply_employee_change(version, None)
+                        show_flash_messages()
+                    except Exception as e:
+                        st.error(f"Error applying bulk change: {e}")
+
+    # --- Display Updated Employee Table ---
+    st.subheader("Current Employees")
+    paginated_grid('current_employees')
+
+employee_management()
 
 st.markdown("---")
 
@@ -691,56 +936,65 @@ st.markdown("---")
 st.markdown("## Machine Learning: Attrition Prediction")
 # This section uses a Random Forest Classifier to predict employee attrition and visualize feature importances.
 
-# --- Prepare dataset for ML ---
-ml_df = df.copy() # Always use the original loaded df for ML to avoid pollution from management operations
+# --- Training data hash (once per data version, not on every rerun) ---
+@st.cache_data(max_entries=8)
+def get_training_hash(version, _frame):
+    return frame_hash(prepare_training_frame(_frame))
+
+# --- Get the current model from the background trainer ---
+# If the data changed, the previous model keeps being served until the refit is swapped in.
 try:
-    # --- Encode categorical columns ---
-    cat_cols = ml_df.select_dtypes(include=['object']).columns
-    for col in cat_cols:
-        ml_df[col] = LabelEncoder().fit_transform(ml_df[col])
-
-    X = ml_df.drop('Attrition', axis=1)
-    y = ml_df['Attrition']
-
-    # --- Train/test split ---
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-    # --- Scale features ---
-    scaler = StandardScaler()
-    X_train = scaler.fit_transform(X_train)
-    X_test = scaler.transform(X_test)
-
-    # --- Train Random Forest model ---
-    rf = RandomForestClassifier(n_estimators=200, random_state=42)
-    rf.fit(X_train, y_train)
-    y_pred = rf.predict(X_test)
-
-    # --- Metrics ---
-    acc = accuracy_score(y_test, y_pred)
-    report = classification_report(y_test, y_pred, target_names=['Stay','Leave'], output_dict=True)
-    report_df = pd.DataFrame(report).transpose()
-    cm = confusion_matrix(y_test, y_pred)
-    cm_df = pd.DataFrame(cm, index=['Actual Stay','Actual Leave'], columns=['Pred Stay','Pred Leave'])
-
-    # --- Feature importance visualization ---
-    feat_importance = pd.DataFrame({
-        'Feature': X.columns,
-        'Importance': rf.feature_importances_
-    }).sort_values(by='Importance', ascending=False)
-
-    fig_feat_imp = px.bar(
-        feat_importance.head(10), x='Importance', y='Feature', orientation='h',
-        title='Top 10 Feature Importances for Attrition Prediction',
-        color='Importance',
-        color_continuous_scale=CUSTOM_PURPLE_RED_GRADIENT,
-        template="plotly_white"
-    )
-    fig_feat_imp.update_layout(yaxis={'categoryorder':'total ascending'})
-    st.plotly_chart(fig_feat_imp, use_container_width=True)
+    trainer = get_model_trainer()
+    with timed_section('model', rows=len(df)):
+        bundle = trainer.request(df, get_training_hash(st.session_state.employees_version, df))
+        if bundle is None:
+            # Nothing trained yet (first start without a persisted model): wait for it once.
+            with st.spinner("Training attrition model..."):
+                bundle = trainer.wait()
+    if trainer.is_training:
+        st.info("🔄 Retraining… showing the previous model until the new one is ready.")
+    if trainer.last_error is not None:
+        st.warning(f"Retraining failed: {trainer.last_error}. Showing the previous model; it is retried when the data changes.")
+    feat_importance = bundle.feature_importance
+
+    col_model_acc, col_model_rows = st.columns(2)
+    col_model_acc.metric("Model Accuracy (Test Set)", f"{bundle.accuracy:.2%}")
+    col_model_rows.metric("Features Used", len(bundle.feature_names))
+
+    def build_fig_feat_imp():
+        fig_feat_imp = px.bar(
+            feat_importance.head(10), x='Importance', y='Feature', orientation='h',
+            title='Top 10 Feature Importances for Attrition Prediction',
+            color='Importance',
+            color_continuous_scale=CUSTOM_PURPLE_RED_GRADIENT,
+            template="plotly_white"
+        )
+        fig_feat_imp.update_layout(yaxis={'categoryorder':'total ascending'})
+        return fig_feat_imp
+    # Keyed on the model, not the data version: it only changes when a refit is swapped in.
+    with timed_section('feature_importance_chart'):
+        st.plotly_chart(get_figure_cache().get_or_build(('feature_importance', bundle.data_hash, None), build_fig_feat_imp), use_container_width=True)
+
+    with st.expander("Model Evaluation Details", expanded=False):
+        st.dataframe(bundle.report_df, use_container_width=True)
+        st.table(bundle.cm_df)
 
 except Exception as e:
     st.error(f"Error during Machine Learning model processing: {e}. Please check your data for consistency.")
     st.info("Ensure all necessary columns are present and data types are correct for ML processing.")
 
+# --- Performance Summary ---
+# p50/p95 per section over the recent timings of all sessions (the full history is in PERF_LOG).
+if st.session_state.get('perf_enabled'):
+    with perf_panel.container():
+        perf_summary = summarize(get_perf_recorder().timings())
+        if perf_summary.empty:
+            st.caption("No timings recorded yet.")
+        else:
+            st.dataframe(perf_summary.round(2), use_container_width=True, hide_index=True)
+            st.caption(f"Recent section runs of all sessions; full log: `{PERF_LOG}`.")
+        if st.button("Clear timings", key='perf_clear'):
+            get_perf_recorder().clear()
+
 # --- End of Dashboard ---
 # The connection managed by st.cache_resource is automatically closed by Streamlit when the app stops.
\ No newline at end of file
@@ -0,0 +1,428 @@
+
+# =========================
+# Employee Database Schema
+# =========================
+# Explicit schema for the SQLite `employee` table and the migrations that bring an
+# existing database up to date. The schema version is tracked in `PRAGMA user_version`,
+# so `migrate()` is a single pragma read once the database is current.
+# =========================
+
+# --- Import Libraries ---
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# --- Global Variables & Setup ---
+DB_NAME = 'data/hr.db'  # SQLite database file
+CSV_PATH = 'data/WA_Fn-UseC_-HR-Employee-Attrition.csv'  # Source CSV for initial data
+
+# Column name -> SQLite type, in CSV order.
+EMPLOYEE_COLUMNS = {
+    'Age': 'INTEGER',
+    'Attrition': 'TEXT',
+    'BusinessTravel': 'TEXT',
+    'DailyRate': 'INTEGER',
+    'Department': 'TEXT',
+    'DistanceFromHome': 'INTEGER',
+    'Education': 'INTEGER',
+    'EducationField': 'TEXT',
+    'EmployeeCount': 'INTEGER',
+    'EmployeeNumber': 'INTEGER PRIMARY KEY',
+    'EnvironmentSatisfaction': 'INTEGER',
+    'Gender': 'TEXT',
+    'HourlyRate': 'INTEGER',
+    'JobInvolvement': 'INTEGER',
+    'JobLevel': 'INTEGER',
+    'JobRole': 'TEXT',
+    'JobSatisfaction': 'INTEGER',
+    'MaritalStatus': 'TEXT',
+    'MonthlyIncome': 'INTEGER',
+    'MonthlyRate': 'INTEGER',
+    'NumCompaniesWorked': 'INTEGER',
+    'Over18': 'TEXT',
+    'OverTime': 'TEXT',
+    'PercentSalaryHike': 'INTEGER',
+    'PerformanceRating': 'INTEGER',
+    'RelationshipSatisfaction': 'INTEGER',
+    'StandardHours': 'INTEGER',
+    'StockOptionLevel': 'INTEGER',
+    'TotalWorkingYears': 'INTEGER',
+    'TrainingTimesLastYear': 'INTEGER',
+    'WorkLifeBalance': 'INTEGER',
+    'YearsAtCompany': 'INTEGER',
+    'YearsInCurrentRole': 'INTEGER',
+    'YearsSinceLastPromotion': 'INTEGER',
+    'YearsWithCurrManager': 'INTEGER',
+}
+
+# In-memory (pandas) dtypes for the employee frame: categoricals for the low-cardinality
+# strings, the narrowest integer type that fits each numeric column (see frames.py).
+EMPLOYEE_DTYPES = {
+    'Age': 'int8',
+    'Attrition': 'category',
+    'BusinessTravel': 'category',
+    'DailyRate': 'int16',
+    'Department': 'category',
+    'DistanceFromHome': 'int8',
+    'Education': 'int8',
+    'EducationField': 'category',
+    'EmployeeCount': 'int8',
+    'EmployeeNumber': 'int32',
+    'EnvironmentSatisfaction': 'int8',
+    'Gender': 'category',
+    'HourlyRate': 'int16',
+    'JobInvolvement': 'int8',
+    'JobLevel': 'int8',
+    'JobRole': 'category',
+    'JobSatisfaction': 'int8',
+    'MaritalStatus': 'category',
+    'MonthlyIncome': 'int32',
+    'MonthlyRate': 'int32',
+    'NumCompaniesWorked': 'int8',
+    'Over18': 'category',
+    'OverTime': 'category',
+    'PercentSalaryHike': 'int8',
+    'PerformanceRating': 'int8',
+    'RelationshipSatisfaction': 'int8',
+    'StandardHours': 'int8',
+    'StockOptionLevel': 'int8',
+    'TotalWorkingYears': 'int8',
+    'TrainingTimesLastYear': 'int8',
+    'WorkLifeBalance': 'int8',
+    'YearsAtCompany': 'int8',
+    'YearsInCurrentRole': 'int8',
+    'YearsSinceLastPromotion': 'int8',
+    'YearsWithCurrManager': 'int8',
+}
+
+# Columns with a single value for every employee in the source data; kept in the database
+# but dropped from in-memory frames.
+CONSTANT_COLUMNS = ['EmployeeCount', 'StandardHours', 'Over18']
+
+# Secondary indexes on the columns used by the dashboard's and app.py's WHERE / GROUP BY /
+# ORDER BY clauses. JobRole and Attrition also carry MonthlyIncome so the average-income
+# breakdowns are answered from the index alone.
+INDEXES = {
+    'idx_employee_department': ['Department'],
+    'idx_employee_jobrole': ['JobRole', 'MonthlyIncome'],
+    'idx_employee_attrition': ['Attrition', 'MonthlyIncome'],
+    'idx_employee_overtime': ['OverTime'],
+    'idx_employee_performancerating': ['PerformanceRating'],
+}
+
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def table_columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({quote(table)})")]
+
+
+def create_employee_table_sql(table='employee'):
+    columns = ',\n    '.join(f"{quote(name)} {sql_type}" for name, sql_type in EMPLOYEE_COLUMNS.items())
+    return f"CREATE TABLE IF NOT EXISTS {quote(table)} (\n    {columns}\n)"
+
+
+def insert_employees_sql(columns, upsert=True):
+    # Prepared insert for the given columns. With `upsert`, an existing EmployeeNumber is
+    # updated in place (ON CONFLICT DO UPDATE, not INSERT OR REPLACE: REPLACE deletes rows
+    # without firing delete triggers, which would corrupt the summary table).
+    names = ', '.join(quote(c) for c in columns)
+    placeholders = ', '.join('?' for _ in columns)
+    sql = f"INSERT INTO employee ({names}) VALUES ({placeholders})"
+    updates = [f"{quote(c)} = excluded.{quote(c)}" for c in columns if c != 'EmployeeNumber']
+    if upsert and updates:
+        sql += f" ON CONFLICT (EmployeeNumber) DO UPDATE SET {', '.join(updates)}"
+    return sql
+
+
+# --- Migrations ---
+# Each migration runs once, in order, inside a transaction; the list index + 1 is the
+# schema version it produces. Never edit a shipped migration, append a new one.
+def _migration_typed_employee_table(conn):
+    # Replace the implicit pandas.to_sql table (no key, no types) with the typed schema,
+    # keeping its rows. Duplicate employee numbers keep their first row.
+    legacy_columns = table_columns(conn, 'employee')
+    if legacy_columns:
+        conn.execute("ALTER TABLE employee RENAME TO employee_legacy")
+    conn.execute(create_employee_table_sql())
+    if legacy_columns:
+        shared = [c for c in legacy_columns if c in EMPLOYEE_COLUMNS]
+        names = ', '.join(quote(c) for c in shared)
+        conn.execute(
+            f"INSERT OR IGNORE INTO employee ({names}) SELECT {names} FROM employee_legacy "
+            "WHERE EmployeeNumber IS NOT NULL ORDER BY rowid"
+        )
+        conn.execute("DROP TABLE employee_legacy")
+
+
+def _migration_employee_indexes(conn):
+    for name, columns in INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON employee ({', '.join(quote(c) for c in columns)})")
+
+
+def _migration_data_version(conn):
+    # Single-row counter bumped by every write to the employee table (see bump_version).
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS employee_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )""")
+    conn.execute("INSERT OR IGNORE INTO employee_version (id, version) VALUES (1, 0)")
+
+
+# --- Summary Table ---
+# `employee_summary` holds one row per combination of the dashboard's grouping dimensions
+# with the employee count and MonthlyIncome sum/count. Triggers keep it in step with every
+# insert, update and delete, so KPI cards and charts read a few hundred rows at most,
+# whatever the headcount. NULL dimension values (e.g. employees added through the forms
+# without an Attrition status) form their own groups; `IS` matches them.
+SUMMARY_DIMENSIONS = ['Department', 'JobRole', 'Attrition', 'OverTime', 'PerformanceRating']
+
+
+def _summary_match(prefix):
+    return ' AND '.join(f"{quote(d)} IS {prefix}.{quote(d)}" for d in SUMMARY_DIMENSIONS)
+
+
+def _summary_add_sql(prefix, sign):
+    # Statements adding (sign=+1) or removing (sign=-1) one employee row's contribution.
+    dims = ', '.join(quote(d) for d in SUMMARY_DIMENSIONS)
+    values = ', '.join(f"{prefix}.{quote(d)}" for d in SUMMARY_DIMENSIONS)
+    op = '+' if sign > 0 else '-'
+    statements = []
+    if sign > 0:
+        statements.append(
+            f"INSERT INTO employee_summary ({dims}, n, income_n, income_sum) SELECT {values}, 0, 0, 0 "
+            f"WHERE NOT EXISTS (SELECT 1 FROM employee_summary WHERE {_summary_match(prefix)})"
+        )
+    statements.append(
+        f"UPDATE employee_summary SET n = n {op} 1, "
+        f"income_n = income_n {op} ({prefix}.MonthlyIncome IS NOT NULL), "
+        f"income_sum = income_sum {op} IFNULL({prefix}.MonthlyIncome, 0) "
+        f"WHERE {_summary_match(prefix)}"
+    )
+    if sign < 0:
+        statements.append("DELETE FROM employee_summary WHERE n = 0")
+    return ';\n    '.join(statements) + ';'
+
+
+def rebuild_summary(conn):
+    # Recompute the summary table from scratch (used by the migration).
+    dims = ', '.join(quote(d) for d in SUMMARY_DIMENSIONS)
+    conn.execute("DELETE FROM employee_summary")
+    conn.execute(
+        f"INSERT INTO employee_summary ({dims}, n, income_n, income_sum) "
+        f"SELECT {dims}, COUNT(*), COUNT(MonthlyIncome), IFNULL(SUM(MonthlyIncome), 0) "
+        f"FROM employee GROUP BY {dims}"
+    )
+
+
+def _migration_employee_summary(conn):
+    dims = ', '.join(f"{quote(d)} {EMPLOYEE_COLUMNS[d]}" for d in SUMMARY_DIMENSIONS)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS employee_summary (
+            {dims},
+            n INTEGER NOT NULL,
+            income_n INTEGER NOT NULL,
+            income_sum INTEGER NOT NULL
+        )""")
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_employee_summary_dims ON employee_summary "
+        f"({', '.join(quote(d) for d in SUMMARY_DIMENSIONS)})"
+    )
+    watched = ', '.join(quote(c) for c in SUMMARY_DIMENSIONS + ['MonthlyIncome'])
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_employee_summary_insert AFTER INSERT ON employee BEGIN
+            {_summary_add_sql('NEW', +1)}
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_employee_summary_delete AFTER DELETE ON employee BEGIN
+            {_summary_add_sql('OLD', -1)}
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_employee_summary_update AFTER UPDATE OF {watched} ON employee BEGIN
+            {_summary_add_sql('OLD', -1)}
+            {_summary_add_sql('NEW', +1)}
+        END""")
+    rebuild_summary(conn)
+
+
+def _migration_column_versions(conn):
+    # Per-column data versions (see bump_version): the data version at which each column's
+    # values last changed, so readers can tell which derived results a write invalidated.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS employee_column_version (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )""")
+    conn.executemany(
+        "INSERT OR IGNORE INTO employee_column_version (name, version) VALUES (?, ?)",
+        [(name, data_version(conn)) for name in EMPLOYEE_COLUMNS],
+    )
+
+
+MIGRATIONS = [
+    _migration_typed_employee_table,
+    _migration_employee_indexes,
+    _migration_data_version,
+    _migration_employee_summary,
+    _migration_column_versions,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    # Apply any pending migrations; returns the resulting schema version.
+    version = schema_version(conn)
+    for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+    return schema_version(conn)
+
+
+# --- Connections ---
+# Pragmas for a read-heavy dashboard: WAL lets readers run while a write commits,
+# synchronous=NORMAL is durable enough under WAL and avoids an fsync per commit, and a
+# larger page cache plus memory-mapped I/O keep repeated reads off the file system.
+# busy_timeout makes a connection wait for a lock held by another process (e.g. the
+# scoring CLI) instead of failing with "database is locked".
+BUSY_TIMEOUT_MS = 5000
+CONNECTION_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': BUSY_TIMEOUT_MS,
+    'cache_size': -16384,  # KiB (16 MiB) per connection
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+
+def connect(path=DB_NAME, read_only=False):
+    # Writers start their transactions with BEGIN IMMEDIATE, so a write never fails halfway
+    # when upgrading a read lock; readers are query_only.
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False,
+                           isolation_level='DEFERRED' if read_only else 'IMMEDIATE')
+    for pragma, value in CONNECTION_PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+class ConnectionPool:
+    # A bounded pool of read-only connections and a single writer connection, used by one
+    # thread at a time. Readers are checked out for a `with` block and returned afterwards;
+    # the most recently returned one is handed out next, so its page cache is still warm.
+    # Streamlit runs every rerun on a new thread, so connections are not tied to threads.
+    def __init__(self, path=DB_NAME, max_readers=8):
+        self.path = path
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_readers)
+        self._write_lock = threading.Lock()
+        self._writer = connect(path)
+        self._closed = False
+
+    @contextmanager
+    def reader(self):
+        # Waits while `max_readers` connections are checked out.
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = connect(self.path, read_only=True)
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                if self._closed:
+                    conn.close()
+                else:
+                    self._idle.put(conn)
+
+    @contextmanager
+    def writer(self):
+        # Serializes in-process writes; commit/rollback is up to the caller (the helpers
+        # below use `with conn:`).
+        with self._write_lock:
+            yield self._writer
+
+    def close(self):
+        # Close the idle readers and the writer; readers still checked out close on return.
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self._writer.close()
+
+
+# --- Data Version ---
+# Readers remember the version their in-memory copy reflects; a writer bumps it inside
+# the same transaction as its change and gets the new value back, so it can tell whether
+# anyone else wrote in between. Each column also records the version at which its values
+# last changed: a write that only touches some columns (e.g. a MonthlyIncome update) leaves
+# results derived from the other columns valid.
+def data_version(conn):
+    return conn.execute("SELECT version FROM employee_version WHERE id = 1").fetchone()[0]
+
+
+def columns_version(conn, columns):
+    # Latest version at which any of `columns` changed.
+    placeholders = ', '.join('?' for _ in columns)
+    return conn.execute(
+        f"SELECT MAX(version) FROM employee_column_version WHERE name IN ({placeholders})", list(columns)
+    ).fetchone()[0]
+
+
+def bump_version(conn, columns=None):
+    # Call inside the write transaction. `columns`: the only columns whose values changed;
+    # None for writes that add or remove rows (every column changes).
+    conn.execute("UPDATE employee_version SET version = version + 1 WHERE id = 1")
+    version = data_version(conn)
+    if columns is None:
+        conn.execute("UPDATE employee_column_version SET version = ?", (version,))
+    else:
+        conn.executemany("UPDATE employee_column_version SET version = ? WHERE name = ?",
+                         [(version, name) for name in columns])
+    return version
+
+
+# --- Employee Writes ---
+# Each helper commits one transaction and returns (rows affected, new data version).
+def insert_employee(conn, record):
+    with conn:
+        cursor = conn.execute(insert_employees_sql(list(record), upsert=False), tuple(record.values()))
+        return cursor.rowcount, bump_version(conn)
+
+
+def update_monthly_income(conn, emp_num, monthly_income):
+    with conn:
+        cursor = conn.execute(
+            "UPDATE employee SET MonthlyIncome = ? WHERE EmployeeNumber = ?", (monthly_income, emp_num)
+        )
+        if cursor.rowcount == 0:
+            return 0, data_version(conn)
+        return cursor.rowcount, bump_version(conn, ['MonthlyIncome'])
+
+
+def delete_employee(conn, emp_num):
+    with conn:
+        cursor = conn.execute("DELETE FROM employee WHERE EmployeeNumber = ?", (emp_num,))
+        if cursor.rowcount == 0:
+            return 0, data_version(conn)
+        return cursor.rowcount, bump_version(conn)
@@ -0,0 +1,54 @@
+
+# =========================
+# Built Figure Cache
+# =========================
+# Process-wide cache of serialized Plotly figures, shared by all dashboard sessions.
+# Building a figure with plotly.express takes ~100 ms; handing Streamlit the cached JSON
+# (as a plain dict) skips the build and most of the validation. Entries are keyed by
+# (figure id, data version, filter), so a write or a different filter simply misses,
+# and the least recently used entries are evicted once `maxsize` is reached.
+# =========================
+
+# --- Import Libraries ---
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+
+class FigureCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._payloads = OrderedDict()  # key -> figure JSON
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def get(self, key):
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is not None:
+                self._payloads.move_to_end(key)
+            return payload
+
+    def put(self, key, payload):
+        with self._lock:
+            self._payloads[key] = payload
+            self._payloads.move_to_end(key)
+            while len(self._payloads) > self.maxsize:
+                self._payloads.popitem(last=False)
+
+    def get_or_build(self, key, build):
+        # Figure spec (dict) for `key`; `build()` returns a Plotly figure and only runs on a miss.
+        payload = self.get(key)
+        if payload is None:
+            self.misses += 1
+            payload = pio.to_json(build(), validate=False)
+            self.put(key, payload)
+        else:
+            self.hits += 1
+        return json.loads(payload)
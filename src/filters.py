@@ -0,0 +1,106 @@
+
+# =========================
+# Employee Filter Engine
+# =========================
+# The dashboard's filter panel as one immutable value: categorical selections
+# (Department, JobRole, OverTime, Attrition) and inclusive Age / MonthlyIncome ranges.
+# A filter compiles to a parameterized SQL WHERE clause, so slices are computed by SQLite
+# on the indexed columns (database.INDEXES) instead of on a pandas copy of the table.
+#
+# Chart data for a slice is the grouped summary shape that metrics.compute_metrics()
+# accepts with weights='summary'. Filters on summary dimensions only are answered from
+# the `employee_summary` table; range filters aggregate the matching employee rows.
+# =========================
+
+# --- Import Libraries ---
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pandas as pd
+
+from database import SUMMARY_DIMENSIONS, quote
+
+# --- Global Variables & Setup ---
+CATEGORY_FILTERS = {'departments': 'Department', 'job_roles': 'JobRole', 'overtime': 'OverTime', 'attrition': 'Attrition'}
+RANGE_FILTERS = {'age': 'Age', 'monthly_income': 'MonthlyIncome'}
+
+
+# --- Filter ---
+@dataclass(frozen=True)
+class EmployeeFilter:
+    departments: tuple = ()  # Empty tuple: no condition
+    job_roles: tuple = ()
+    overtime: tuple = ()
+    attrition: tuple = ()
+    age: tuple = None  # (low, high), inclusive; None: no condition
+    monthly_income: tuple = None
+
+    def columns(self):
+        # Columns this filter puts a condition on.
+        return [col for field, col in {**CATEGORY_FILTERS, **RANGE_FILTERS}.items() if getattr(self, field)]
+
+    def is_empty(self):
+        return not self.columns()
+
+    def to_sql(self):
+        # (where, params): a predicate without the WHERE keyword, '' when there is no condition.
+        conditions, params = [], []
+        for field, col in CATEGORY_FILTERS.items():
+            values = getattr(self, field)
+            if values:
+                conditions.append(f"{quote(col)} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        for field, col in RANGE_FILTERS.items():
+            bounds = getattr(self, field)
+            if bounds:
+                conditions.append(f"{quote(col)} BETWEEN ? AND ?")
+                params.extend(bounds)
+        return ' AND '.join(conditions), tuple(params)
+
+
+# --- Slices ---
+def filtered_summary(conn, employee_filter):
+    # Grouped counts/income for the slice, in the employee_summary column layout.
+    where, params = employee_filter.to_sql()
+    where_sql = f" WHERE {where}" if where else ""
+    dims = ', '.join(quote(d) for d in SUMMARY_DIMENSIONS)
+    if set(employee_filter.columns()) <= set(SUMMARY_DIMENSIONS):
+        return pd.read_sql(f"SELECT * FROM employee_summary{where_sql}", conn, params=params)
+    return pd.read_sql(
+        f"SELECT {dims}, COUNT(*) AS n, COUNT(MonthlyIncome) AS income_n, "
+        f"IFNULL(SUM(MonthlyIncome), 0) AS income_sum FROM employee{where_sql} GROUP BY {dims}",
+        conn, params=params,
+    )
+
+
+def column_bounds(conn, columns):
+    # {column: (min, max)} over the whole table, for the range widgets.
+    select = ', '.join(f"MIN({quote(c)}), MAX({quote(c)})" for c in columns)
+    row = conn.execute(f"SELECT {select} FROM employee").fetchone()
+    return {col: (row[2 * i], row[2 * i + 1]) for i, col in enumerate(columns)}
+
+
+# --- Count Cache ---
+class FilterCountCache:
+    # Matching-row counts per (data version, filter), with least-recently-used eviction.
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._counts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def count(self, conn, version, employee_filter):
+        key = (version, employee_filter)
+        with self._lock:
+            if key in self._counts:
+                self._counts.move_to_end(key)
+                return self._counts[key]
+        where, params = employee_filter.to_sql()
+        where_sql = f" WHERE {where}" if where else ""
+        count = conn.execute(f"SELECT COUNT(*) FROM employee{where_sql}", params).fetchone()[0]
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+        return count
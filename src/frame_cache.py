@@ -0,0 +1,116 @@
+
+# =========================
+# Columnar Employee Frame Cache
+# =========================
+# Optional on-disk copy of the compact employee frame (frames.py) as an uncompressed
+# Arrow IPC file. Cold starts memory-map it instead of re-reading the employee table:
+# numeric columns without missing values come back without copying, and categoricals
+# keep their dtype, so no re-optimization is needed.
+#
+# The file records the database it was read from (its resolved path, so several databases
+# can share the cache directory), the data version (database.data_version) and the checksum
+# of the last ingested CSV it reflects. Every write through the dashboard, a bulk upload or a CSV
+# ingest bumps the version, so a stale file is simply not used and gets replaced.
+# Without pyarrow, for in-memory databases and for databases that are not migrated yet (no
+# data version to check a file against), the cache is disabled and frames are loaded from
+# SQLite as before.
+# =========================
+
+# --- Import Libraries ---
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # Optional dependency
+    pa = feather = None
+
+from database import data_version
+from frames import load_employee_frame
+
+# --- Global Variables & Setup ---
+FRAME_CACHE_DIR = 'data/cache'
+METADATA_KEY = b'hr_dashboard'
+
+
+def available():
+    return pa is not None
+
+
+def database_path(conn):
+    # Resolved file of the connection's main database ('' for an in-memory one).
+    path = next(row[2] for row in conn.execute("PRAGMA database_list") if row[1] == 'main')
+    return os.path.realpath(path) if path else ''
+
+
+def cache_key(conn):
+    # (database path, data version, checksum of the last ingested source file or ''),
+    # or None if the database has no data version yet (not migrated).
+    try:
+        version = data_version(conn)
+    except sqlite3.OperationalError:
+        return None
+    try:
+        row = conn.execute("SELECT checksum FROM ingest_meta ORDER BY loaded_at DESC LIMIT 1").fetchone()
+    except Exception:
+        row = None  # No ingest_meta table yet
+    return database_path(conn), version, row[0] if row else ''
+
+
+def _file_prefix(db_path):
+    return f"employee-{hashlib.sha256(db_path.encode()).hexdigest()[:12]}"
+
+
+def cache_path(key, cache_dir=FRAME_CACHE_DIR):
+    db_path, version, checksum = key
+    return os.path.join(cache_dir, f"{_file_prefix(db_path)}-v{version}-{checksum[:12] or 'nosrc'}.arrow")
+
+
+def write_frame_cache(frame, key, memory_report, cache_dir=FRAME_CACHE_DIR):
+    # Atomically write the frame for `key` and remove older files of the same database.
+    os.makedirs(cache_dir, exist_ok=True)
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    meta = {'database': key[0], 'version': key[1], 'checksum': key[2], 'memory_report': memory_report}
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), METADATA_KEY: json.dumps(meta).encode()})
+    path = cache_path(key, cache_dir)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+    for old in glob.glob(os.path.join(cache_dir, f'{_file_prefix(key[0])}-v*.arrow')):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass  # Another process may still have it mapped (Windows) or removed it already
+    return path
+
+
+def read_frame_cache(key, cache_dir=FRAME_CACHE_DIR):
+    # (frame, memory report) from the memory-mapped file for `key`, or None if there is none.
+    path = cache_path(key, cache_dir)
+    if not os.path.exists(path):
+        return None
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    meta = json.loads(table.schema.metadata[METADATA_KEY])
+    if (meta.get('database'), meta['version'], meta['checksum']) != tuple(key):
+        return None
+    return table.to_pandas(split_blocks=True), meta['memory_report']
+
+
+def load_employee_frame_cached(conn, cache_dir=FRAME_CACHE_DIR):
+    # Drop-in for frames.load_employee_frame: serve the columnar cache when it matches the
+    # database, otherwise load from SQLite and refresh the cache.
+    key = cache_key(conn) if available() and cache_dir is not None else None
+    if key is None or not key[0]:  # Disabled, unmigrated or an in-memory database
+        return load_employee_frame(conn)
+    cached = read_frame_cache(key, cache_dir)
+    if cached is not None:
+        return cached
+    frame, report = load_employee_frame(conn)
+    write_frame_cache(frame, key, report, cache_dir)
+    return frame, report
@@ -0,0 +1,92 @@
+
+# =========================
+# Compact Employee Frames
+# =========================
+# Schema-driven dtype optimization for the in-memory employee DataFrame. Low-cardinality
+# strings become categoricals, integers are narrowed to the width declared in
+# database.EMPLOYEE_DTYPES (widened again if a value does not fit), and the constant
+# columns are dropped. Per-session memory is what limits concurrent dashboard users,
+# so every frame the dashboard keeps goes through here.
+# =========================
+
+# --- Import Libraries ---
+import numpy as np
+import pandas as pd
+
+from database import CONSTANT_COLUMNS, EMPLOYEE_DTYPES
+
+
+def frame_memory(df):
+    # Deep memory usage in bytes (includes the Python string objects of object columns).
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _int_dtype(series, declared):
+    # Declared integer width, widened if the data does not fit; nullable if values are missing.
+    dtype = np.dtype(declared)
+    values = series.dropna()
+    if len(values):
+        low, high = values.min(), values.max()
+        for candidate in ('int8', 'int16', 'int32', 'int64'):
+            info = np.iinfo(candidate)
+            if np.dtype(candidate).itemsize >= dtype.itemsize and info.min <= low and high <= info.max:
+                dtype = np.dtype(candidate)
+                break
+    return dtype.name.capitalize() if series.isna().any() else dtype.name
+
+
+def optimize_employee_frame(df, drop_constant=True):
+    # Return a compact copy of an employee frame with the schema's dtypes applied.
+    if drop_constant:
+        df = df.drop(columns=[c for c in CONSTANT_COLUMNS if c in df.columns])
+    dtypes = {}
+    for col in df.columns:
+        declared = EMPLOYEE_DTYPES.get(col)
+        if declared == 'category':
+            dtypes[col] = 'category'
+        elif declared is not None and pd.api.types.is_numeric_dtype(df[col]):
+            if df[col].dropna().mod(1).eq(0).all():
+                dtypes[col] = _int_dtype(df[col], declared)
+    return df.astype(dtypes)
+
+
+def load_employee_frame(conn, query="SELECT * FROM employee"):
+    # Read employees from SQLite and optimize them. Returns (frame, memory report).
+    raw = pd.read_sql(query, conn)
+    frame = optimize_employee_frame(raw)
+    report = {'before_bytes': frame_memory(raw), 'after_bytes': frame_memory(frame)}
+    return frame, report
+
+
+def append_employees(frame, new_rows):
+    # Append rows without losing the compact dtypes: new categories are appended to the
+    # existing ones (codes stay valid) and integer columns become nullable only if needed.
+    new_rows = new_rows.reindex(columns=frame.columns)
+    frame = frame.copy(deep=False)
+    for col in frame.columns:
+        dtype = frame[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            new_categories = pd.Index(new_rows[col].dropna().unique()).difference(dtype.categories)
+            if len(new_categories):
+                frame[col] = frame[col].cat.add_categories(new_categories)
+            new_rows[col] = pd.Categorical(new_rows[col], categories=frame[col].cat.categories)
+        elif pd.api.types.is_integer_dtype(dtype) and new_rows[col].isna().any():
+            frame[col] = frame[col].astype(dtype.name.capitalize())
+            new_rows[col] = new_rows[col].astype(frame[col].dtype)
+        else:
+            new_rows[col] = new_rows[col].astype(dtype)
+    return pd.concat([frame, new_rows], ignore_index=True)
+
+
+def set_monthly_income(frame, employee_number, income):
+    # New frame with one employee's MonthlyIncome replaced; every other column is shared.
+    frame = frame.copy(deep=False)
+    frame['MonthlyIncome'] = frame['MonthlyIncome'].mask(frame['EmployeeNumber'] == employee_number, income)
+    return frame
+
+
+def drop_employees(frame, employee_numbers):
+    # New frame without the given employees.
+    keep = ~frame['EmployeeNumber'].isin(list(employee_numbers))
+    return frame[keep].reset_index(drop=True)
+
@@ -0,0 +1,193 @@
+
+# =========================
+# Employee Data Ingestion
+# =========================
+# Loads the source CSV into the SQLite `employee` table only when it is needed: the
+# table is empty, or the CSV changed since the last load. Rows are upserted on
+# EmployeeNumber, so employees added through the dashboard are kept. The file's size
+# and mtime are recorded in `ingest_meta`, so the usual startup cost is one stat() and
+# one metadata lookup. The SHA-256 checksum is only computed when the mtime changed.
+#
+# Ingestion streams: the CSV is parsed in chunks with explicit dtypes (only the schema's
+# columns), and the rows of all chunks are fed lazily into one prepared executemany inside
+# a single transaction, hashing the file on the same pass. Memory is bounded by the chunk
+# size, so multi-GB HRIS exports load without reading the whole file into pandas.
+#
+# Usage:
+#   python src/ingest.py --csv export.csv --db data/hr.db --chunksize 100000
+# =========================
+
+# --- Import Libraries ---
+import argparse
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+
+try:
+    import resource  # Peak RSS; not available on Windows
+except ImportError:
+    resource = None
+
+import pandas as pd
+
+from database import CSV_PATH, DB_NAME, EMPLOYEE_COLUMNS, bump_version, connect, insert_employees_sql, migrate
+
+# --- Global Variables & Setup ---
+INGEST_META_TABLE = 'ingest_meta'
+CHUNKSIZE = 50_000
+# Parse dtypes from the schema: nullable integers and plain strings, so no column is
+# type-inferred per chunk (inference can differ between chunks of the same file).
+CSV_DTYPES = {
+    name: 'Int64' if sql_type.startswith('INTEGER') else 'object'
+    for name, sql_type in EMPLOYEE_COLUMNS.items()
+}
+
+
+@dataclass
+class IngestReport:
+    rows: int
+    seconds: float
+    peak_memory_bytes: int = None  # Process peak RSS (None where the platform does not report it)
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class _HashingReader:
+    # File wrapper that hashes whatever the CSV parser reads, so the checksum needs no extra pass.
+    def __init__(self, f):
+        self._f = f
+        self.digest = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self._f.read(size)
+        self.digest.update(data)
+        return data
+
+    def __iter__(self):
+        return iter(lambda: self.read(1 << 20), b'')
+
+
+def file_checksum(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _ensure_meta_table(conn):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {INGEST_META_TABLE} (
+            source TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            checksum TEXT NOT NULL,
+            loaded_at REAL NOT NULL
+        )""")
+
+
+def _record_meta(conn, csv_path, stat, checksum):
+    conn.execute(
+        f"INSERT OR REPLACE INTO {INGEST_META_TABLE} (source, size, mtime_ns, checksum, loaded_at) VALUES (?, ?, ?, ?, ?)",
+        (os.path.abspath(csv_path), stat.st_size, stat.st_mtime_ns, checksum, time.time()),
+    )
+
+
+def needs_ingest(conn, csv_path):
+    # Decide whether `csv_path` has to be (re)loaded into the employee table.
+    if conn.execute("SELECT 1 FROM employee LIMIT 1").fetchone() is None:
+        return True
+    if not os.path.exists(csv_path):
+        return False  # Keep serving the existing table
+    _ensure_meta_table(conn)
+    stat = os.stat(csv_path)
+    row = conn.execute(
+        f"SELECT size, mtime_ns, checksum FROM {INGEST_META_TABLE} WHERE source = ?",
+        (os.path.abspath(csv_path),),
+    ).fetchone()
+    if row is None:
+        return True
+    size, mtime_ns, checksum = row
+    if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+        return False
+    # The file was touched: only reload if its content really changed.
+    if size == stat.st_size and checksum == file_checksum(csv_path):
+        with conn:
+            _record_meta(conn, csv_path, stat, checksum)
+        return False
+    return True
+
+
+def _header(csv_path):
+    return pd.read_csv(csv_path, nrows=0).columns
+
+
+def _chunk_rows(chunks, columns, counter):
+    # Row tuples of every chunk, with NULL for missing values; counts rows as they pass.
+    for chunk in chunks:
+        counter[0] += len(chunk)
+        rows = chunk[columns].astype(object)
+        yield from rows.where(chunk[columns].notna(), None).itertuples(index=False, name=None)
+
+
+def peak_memory_bytes():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # Linux reports KiB
+
+
+def ingest_csv(conn, csv_path, chunksize=CHUNKSIZE):
+    # Stream the CSV into the employee table (upsert on EmployeeNumber) and record its
+    # fingerprint, all in one transaction. Returns an IngestReport.
+    start = time.perf_counter()
+    stat = os.stat(csv_path)
+    columns = [c for c in _header(csv_path) if c in EMPLOYEE_COLUMNS]
+    counter = [0]
+    _ensure_meta_table(conn)
+    with open(csv_path, 'rb') as f:
+        reader = _HashingReader(f)
+        chunks = pd.read_csv(reader, usecols=columns, dtype={c: CSV_DTYPES[c] for c in columns},
+                             chunksize=chunksize)
+        with conn:
+            conn.executemany(insert_employees_sql(columns), _chunk_rows(chunks, columns, counter))
+            reader.read()  # Hash anything the parser did not consume
+            _record_meta(conn, csv_path, stat, reader.digest.hexdigest())
+            bump_version(conn)
+    return IngestReport(rows=counter[0], seconds=time.perf_counter() - start, peak_memory_bytes=peak_memory_bytes())
+
+
+def ensure_employee_table(conn, csv_path):
+    # Idempotent startup step: bring the schema up to date, then load the CSV if needed.
+    # Returns True if the CSV was (re)loaded.
+    migrate(conn)
+    if not needs_ingest(conn, csv_path):
+        return False
+    ingest_csv(conn, csv_path)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load an employee CSV into the SQLite employee table.")
+    parser.add_argument('--csv', default=CSV_PATH, help="Employee CSV (HRIS export)")
+    parser.add_argument('--db', default=DB_NAME, help="SQLite database")
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE, help="CSV rows parsed per chunk")
+    parser.add_argument('--force', action='store_true', help="Ingest even if the CSV is unchanged")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    migrate(conn)
+    if not args.force and not needs_ingest(conn, args.csv):
+        print(f"'{args.csv}' is unchanged since the last load; nothing to do (use --force to reload).")
+        return
+    report = ingest_csv(conn, args.csv, args.chunksize)
+    conn.close()
+    peak = f", peak memory {report.peak_memory_bytes / 1e6:.0f} MB" if report.peak_memory_bytes else ""
+    print(f"Ingested {report.rows:,} rows from '{args.csv}' in {report.seconds:.2f}s "
+          f"({report.rows_per_sec:,.0f} rows/s{peak})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+
+# =========================
+# Dashboard Metrics Engine
+# =========================
+# Computes every KPI and grouped breakdown the dashboard shows in one vectorized pass.
+# Each grouping dimension is turned into integer codes, the codes are combined into one
+# cell index, and three np.bincount calls accumulate employee counts and MonthlyIncome
+# sums/counts into a small dense cube (Department x JobRole x Attrition x OverTime x
+# PerformanceRating). All breakdowns are then axis sums over that cube.
+#
+# The same engine runs on the raw employee frame (one row = one employee) and on the
+# precomputed `employee_summary` table (one row = one group, weighted by its counts).
+# =========================
+
+# --- Import Libraries ---
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from database import SUMMARY_DIMENSIONS
+
+
+# --- Results Object ---
+@dataclass
+class DashboardMetrics:
+    total_employees: int
+    not_left_count: int
+    attrition_count: int
+    attrition_rate: float
+    avg_monthly_income: float
+    department_counts: pd.DataFrame  # Department, EmployeeCount
+    average_income_by_role: pd.DataFrame  # JobRole, AverageMonthlyIncome
+    attrition_by_department_role: pd.DataFrame  # Department, JobRole, AttritionRate, TotalEmployees
+    performance_vs_attrition: pd.DataFrame  # PerformanceRating, No, Yes
+    attrition_by_role_overtime: pd.DataFrame  # JobRole, OverTime, No, Yes, EmployeeCount, AttritionRate
+    income_by_attrition: pd.DataFrame  # Attrition, MonthlyIncome
+    best_department: tuple  # (Department, average PerformanceRating) or None
+
+
+# --- Encoding ---
+def _codes(values):
+    # Integer codes and sorted categories for one dimension; missing values get code -1.
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values, sort=True)
+
+
+def _cube(frame, n, income_sum, income_n):
+    # Accumulate the three measures into dense arrays shaped (len(categories) + 1, ...) per
+    # dimension; the extra trailing slot on each axis collects missing values.
+    codes, categories = [], []
+    for dim in SUMMARY_DIMENSIONS:
+        dim_codes, dim_categories = _codes(frame[dim])
+        # Code -1 (missing) moves to the trailing slot.
+        codes.append(np.where(dim_codes < 0, len(dim_categories), dim_codes))
+        categories.append(dim_categories)
+    shape = tuple(len(c) + 1 for c in categories)
+    cell = np.ravel_multi_index(codes, shape) if len(frame) else np.zeros(0, dtype=np.intp)
+    size = int(np.prod(shape))
+    cubes = [
+        np.bincount(cell, weights=weights, minlength=size).reshape(shape)
+        for weights in (n, income_sum, income_n)
+    ]
+    return cubes, categories
+
+
+def _known(array, axes):
+    # Drop the missing-value slot on the given axes.
+    index = tuple(slice(None, -1) if axis in axes else slice(None) for axis in range(array.ndim))
+    return array[index]
+
+
+# --- Engine ---
+def compute_metrics(frame, weights=None):
+    # One scan over `frame`. Without `weights`, every row is one employee and MonthlyIncome
+    # is read from the frame. With `weights='summary'`, the frame is employee_summary and
+    # its n / income_sum / income_n columns are accumulated instead.
+    if weights == 'summary':
+        n = frame['n'].to_numpy(dtype=np.float64)
+        income_sum = frame['income_sum'].to_numpy(dtype=np.float64)
+        income_n = frame['income_n'].to_numpy(dtype=np.float64)
+    else:
+        income = frame['MonthlyIncome'].to_numpy(dtype=np.float64, na_value=np.nan)
+        known_income = ~np.isnan(income)
+        n = None
+        income_sum = np.where(known_income, income, 0.0)
+        income_n = known_income.astype(np.float64)
+    (n_cube, sum_cube, cnt_cube), (departments, roles, attrition, overtime, ratings) = _cube(
+        frame, n, income_sum, income_n
+    )
+    DEPT, ROLE, ATTR, OT, PERF = range(5)
+    attr_index = {value: i for i, value in enumerate(attrition)}
+
+    def attr_slice(cube, value):
+        # Sub-cube for one Attrition value (zeros if the value never occurs).
+        if value not in attr_index:
+            return np.zeros_like(cube.take(0, axis=ATTR))
+        return cube.take(attr_index[value], axis=ATTR)
+
+    # --- KPIs ---
+    total = int(n_cube.sum())
+    not_left = int(attr_slice(n_cube, 'No').sum())
+    left = int(attr_slice(n_cube, 'Yes').sum())
+    income_n_total = cnt_cube.sum()
+
+    # --- Department counts / average income by job role ---
+    dept_n = _known(n_cube.sum(axis=(ROLE, ATTR, OT, PERF)), {0})
+    role_sum = _known(sum_cube.sum(axis=(DEPT, ATTR, OT, PERF)), {0})
+    role_cnt = _known(cnt_cube.sum(axis=(DEPT, ATTR, OT, PERF)), {0})
+
+    # --- Attrition rate by Department x JobRole ---
+    dr_total = _known(n_cube.sum(axis=(ATTR, OT, PERF)), {0, 1})
+    dr_no = _known(attr_slice(n_cube, 'No').sum(axis=(2, 3)), {0, 1})  # axes after dropping ATTR
+    dr_yes = _known(attr_slice(n_cube, 'Yes').sum(axis=(2, 3)), {0, 1})
+    dr_present = np.nonzero(dr_total)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dr_rate = np.round(dr_yes / (dr_no + dr_yes) * 100, 2)
+    attrition_by_department_role = pd.DataFrame({
+        'Department': departments[dr_present[0]],
+        'JobRole': roles[dr_present[1]],
+        'AttritionRate': dr_rate[dr_present],
+        'TotalEmployees': dr_total[dr_present].astype(int),
+    })
+
+    # --- Performance rating vs attrition ---
+    perf_no = _known(attr_slice(n_cube, 'No').sum(axis=(0, 1, 2)), {0})
+    perf_yes = _known(attr_slice(n_cube, 'Yes').sum(axis=(0, 1, 2)), {0})
+    perf_present = np.nonzero(perf_no + perf_yes)[0]
+    performance_vs_attrition = pd.DataFrame({
+        'PerformanceRating': np.asarray(ratings)[perf_present].astype(int),
+        'No': perf_no[perf_present].astype(int),
+        'Yes': perf_yes[perf_present].astype(int),
+    })
+
+    # --- Attrition rate by JobRole x OverTime ---
+    ro_no = _known(attr_slice(n_cube, 'No').sum(axis=(0, 3)), {0, 1})
+    ro_yes = _known(attr_slice(n_cube, 'Yes').sum(axis=(0, 3)), {0, 1})
+    ro_count = ro_no + ro_yes
+    ro_present = np.nonzero(ro_count)
+    attrition_by_role_overtime = pd.DataFrame({
+        'JobRole': roles[ro_present[0]],
+        'OverTime': overtime[ro_present[1]],
+        'No': ro_no[ro_present].astype(int),
+        'Yes': ro_yes[ro_present].astype(int),
+        'EmployeeCount': ro_count[ro_present].astype(int),
+        'AttritionRate': np.round(ro_yes[ro_present] / ro_count[ro_present] * 100, 2),
+    })
+
+    # --- Average income by attrition status ---
+    attr_sum = _known(sum_cube.sum(axis=(DEPT, ROLE, OT, PERF)), {0})
+    attr_cnt = _known(cnt_cube.sum(axis=(DEPT, ROLE, OT, PERF)), {0})
+    attr_present = np.nonzero(attr_cnt)[0]
+    income_by_attrition = pd.DataFrame({
+        'Attrition': attrition[attr_present],
+        'MonthlyIncome': attr_sum[attr_present] / attr_cnt[attr_present],
+    })
+
+    # --- Department with the highest average performance rating ---
+    dept_perf_n = _known(n_cube.sum(axis=(ROLE, ATTR, OT)), {0, 1})
+    best_department = None
+    if dept_perf_n.sum() > 0:
+        rated = dept_perf_n.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_rating = (dept_perf_n * np.asarray(ratings, dtype=np.float64)).sum(axis=1) / rated
+        best = int(np.nanargmax(np.where(rated > 0, avg_rating, np.nan)))
+        best_department = (departments[best], float(avg_rating[best]))
+
+    dept_present = np.nonzero(dept_n)[0]
+    role_present = np.nonzero(role_cnt)[0]
+    return DashboardMetrics(
+        total_employees=total,
+        not_left_count=not_left,
+        attrition_count=left,
+        attrition_rate=left / total * 100 if total > 0 else 0,
+        avg_monthly_income=sum_cube.sum() / income_n_total if income_n_total else float('nan'),
+        department_counts=pd.DataFrame({
+            'Department': departments[dept_present], 'EmployeeCount': dept_n[dept_present].astype(int)
+        }),
+        average_income_by_role=pd.DataFrame({
+            'JobRole': roles[role_present], 'AverageMonthlyIncome': role_sum[role_present] / role_cnt[role_present]
+        }),
+        attrition_by_department_role=attrition_by_department_role,
+        performance_vs_attrition=performance_vs_attrition,
+        attrition_by_role_overtime=attrition_by_role_overtime,
+        income_by_attrition=income_by_attrition,
+        best_department=best_department,
+    )
+
+
+# --- Summary Table ---
+def load_summary(conn):
+    return pd.read_sql("SELECT * FROM employee_summary", conn)
+
+
+def metrics_from_summary(summary):
+    return compute_metrics(summary, weights='summary')
@@ -0,0 +1,444 @@
+
+# =========================
+# Attrition Prediction Model
+# =========================
+# Training and on-disk persistence for the Random Forest attrition model.
+# A trained model is identified by a content hash of its training frame plus
+# its hyperparameters, so the dashboard only refits when one of them changes
+# and a restarted container can pick the fitted model up from disk.
+#
+# scikit-learn and joblib are imported inside the functions that need them: importing
+# them costs over a second, and pages that never train or load a model should not pay it.
+# =========================
+
+# --- Import Libraries ---
+import copy
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+# --- Global Variables & Setup ---
+MODEL_DIR = 'data/models'  # Directory for persisted model artifacts
+MODELS_KEPT = 5  # Newest artifacts kept in MODEL_DIR; older ones are removed after each save
+TARGET = 'Attrition'
+ID_COLUMNS = ['EmployeeNumber']  # Row identifiers, never used as features
+FAST_PATH_ROWS = 64  # Batches up to this size skip RandomForest's validation/dispatch overhead
+
+
+# --- Training Configuration ---
+# `n_jobs` only changes how many cores build the trees; with a fixed `random_state` the
+# fitted forest is identical for any value, so it is left out of the cache key.
+# With `warm_start`, a refit keeps the previous model's feature pipeline and trees and only
+# grows `warm_start_trees` new trees on the current data. Once the forest reaches
+# `max_estimators`, the oldest trees are dropped to make room (a rolling refresh).
+# The train/test split is decided per employee (see split_rows), so an employee stays on the
+# same side across refits and warm-started trees never saw the current test rows.
+# Each refit seeds its new trees from the model's lineage (see next_lineage): reusing
+# `random_state` would regrow the same trees every time and the forest would fill with copies.
+@dataclass(frozen=True)
+class TrainingConfig:
+    n_estimators: int = 200
+    random_state: int = 42
+    n_jobs: int = -1  # -1 = all cores
+    test_size: float = 0.2
+    warm_start: bool = False
+    warm_start_trees: int = 20
+    max_estimators: int = 400
+
+    def model_params(self):
+        return {'n_estimators': self.n_estimators, 'random_state': self.random_state, 'n_jobs': self.n_jobs}
+
+    def cache_key(self):
+        key = asdict(self)
+        key.pop('n_jobs')
+        return key
+
+
+DEFAULT_CONFIG = TrainingConfig()
+
+
+# --- Feature Pipeline ---
+# Frozen preprocessing fitted alongside the forest: category -> code maps (the same codes
+# LabelEncoder produces) and StandardScaler's mean/scale. Plain dicts and arrays, so it
+# pickles with the model and can transform a single record without building a DataFrame.
+@dataclass
+class FeaturePipeline:
+    feature_names: list
+    category_maps: dict  # column -> {category: code}
+    mean: np.ndarray
+    scale: np.ndarray
+    defaults: dict  # typical raw value per feature (mode / median), for incomplete records
+
+    @classmethod
+    def fit(cls, X, train_rows):
+        # Category maps and defaults come from all rows, scaling statistics from the train rows.
+        cat_cols = X.select_dtypes(include=['object', 'string', 'category']).columns
+        category_maps = {
+            col: {value: code for code, value in enumerate(sorted(X[col].astype(str).unique()))}
+            for col in cat_cols
+        }
+        defaults = {
+            col: X[col].astype(str).mode().iloc[0] if col in category_maps else float(X[col].median())
+            for col in X.columns
+        }
+        pipeline = cls(list(X.columns), category_maps, None, None, defaults)
+        codes, _ = pipeline.encode(X.iloc[train_rows])
+        pipeline.mean = codes.mean(axis=0)
+        scale = codes.std(axis=0)
+        scale[scale == 0] = 1.0
+        pipeline.scale = scale
+        return pipeline
+
+    def covers(self, X):
+        # True if `X` has exactly these features and no category outside the frozen maps.
+        if list(X.columns) != self.feature_names:
+            return False
+        return all(X[col].astype(str).isin(mapping).all() for col, mapping in self.category_maps.items())
+
+    def encode(self, frame):
+        # Unscaled feature matrix plus a mask of the rows that could be encoded
+        # (rows with missing values or unseen categories are not scoreable).
+        X = frame.reindex(columns=self.feature_names)
+        valid = X.notna().all(axis=1).to_numpy().copy()
+        matrix = np.empty((len(X), len(self.feature_names)), dtype=np.float64)
+        for i, col in enumerate(self.feature_names):
+            if col in self.category_maps:
+                codes = X[col].astype(str).map(self.category_maps[col])
+                valid &= codes.notna().to_numpy()
+                matrix[:, i] = codes.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                matrix[:, i] = X[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        return matrix[valid], valid
+
+    def transform(self, frame):
+        codes, valid = self.encode(frame)
+        return (codes - self.mean) / self.scale, valid
+
+    def transform_record(self, record, fill_missing=False):
+        # Fast path for one employee given as a dict. Returns a (1, n_features) array, or None
+        # if a value is missing (and `fill_missing` is off) or a category was never seen.
+        row = np.empty(len(self.feature_names), dtype=np.float64)
+        for i, col in enumerate(self.feature_names):
+            value = record.get(col)
+            if value is None or value != value:  # None or NaN
+                if not fill_missing:
+                    return None
+                value = self.defaults[col]
+            if col in self.category_maps:
+                value = self.category_maps[col].get(str(value))
+                if value is None:
+                    return None
+            row[i] = value
+        return ((row - self.mean) / self.scale).reshape(1, -1)
+
+
+# --- Trained Model Bundle ---
+# Everything the dashboard needs from one training run: the fitted feature pipeline
+# (so new rows are transformed the same way), the forest and its metrics.
+@dataclass
+class AttritionModel:
+    data_hash: str
+    config: TrainingConfig
+    pipeline: FeaturePipeline
+    model: object  # sklearn.ensemble.RandomForestClassifier
+    accuracy: float
+    report_df: pd.DataFrame
+    cm_df: pd.DataFrame
+    feature_importance: pd.DataFrame
+    lineage: str = ''  # Refit history of a warm-started model ('' for a full fit)
+
+    @property
+    def feature_names(self):
+        return self.pipeline.feature_names
+
+    @cached_property
+    def _leaf_risk(self):
+        # Per tree: leave probability of every node, precomputed once per model.
+        leave_idx = list(self.model.classes_).index(1)
+        leaf_risk = []
+        for tree in self.model.estimators_:
+            value = tree.tree_.value[:, 0, :]
+            leaf_risk.append(value[:, leave_idx] / value.sum(axis=1))
+        return leaf_risk
+
+    def predict_proba(self, X):
+        # Leave probability for transformed rows. Small batches look the leaves up directly,
+        # skipping RandomForest.predict_proba's input validation and thread-pool dispatch.
+        if len(X) > FAST_PATH_ROWS:
+            leave_idx = list(self.model.classes_).index(1)
+            return self.model.predict_proba(X)[:, leave_idx]
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        risk = sum(leaf_risk[tree.tree_.apply(X)] for tree, leaf_risk in zip(self.model.estimators_, self._leaf_risk))
+        return risk / len(self.model.estimators_)
+
+    def predict_one(self, record, fill_missing=False):
+        # Leave probability for a single employee record (dict), or None if it cannot be scored.
+        X = self.pipeline.transform_record(record, fill_missing=fill_missing)
+        if X is None:
+            return None
+        return float(self.predict_proba(X)[0])
+
+
+# --- Hashing Helpers ---
+def frame_hash(df):
+    # Content hash of a DataFrame: column names plus row-wise hashes of the values.
+    digest = hashlib.sha256(json.dumps(list(map(str, df.columns))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def config_hash(config):
+    return hashlib.sha256(json.dumps(config.cache_key(), sort_keys=True).encode()).hexdigest()
+
+
+def next_lineage(previous, config):
+    # Lineage of a model warm-started from `previous`: chains every model it grew from, so
+    # two forests for the same data and config but a different refit history never collide.
+    key = json.dumps([previous.lineage, previous.data_hash, config.random_state])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def model_path(data_hash, config, model_dir=MODEL_DIR, lineage=''):
+    suffix = f"-w{lineage[:12]}" if lineage else ''
+    return os.path.join(model_dir, f"rf-{data_hash[:16]}-{config_hash(config)[:8]}{suffix}.joblib")
+
+
+# --- Training ---
+def prepare_training_frame(df):
+    # Drop identifier columns and incomplete rows (employees added through the
+    # management forms only carry a handful of columns).
+    ml_df = df.drop(columns=[c for c in ID_COLUMNS if c in df.columns])
+    return ml_df.dropna().reset_index(drop=True)
+
+
+def split_rows(employee_numbers, test_size, random_state):
+    # (train rows, test rows) positions. Each employee's side is fixed by a hash of their
+    # EmployeeNumber (salted with random_state): adding or deleting employees never moves
+    # anyone else between train and test.
+    hashes = pd.util.hash_pandas_object(
+        pd.Series(employee_numbers, dtype='int64'), index=False, hash_key=f'{random_state:016d}'[-16:]
+    ).to_numpy()
+    test = hashes < np.uint64(test_size * 2.0 ** 64)
+    return np.flatnonzero(~test), np.flatnonzero(test)
+
+
+def train_model(df, config=DEFAULT_CONFIG, data_hash=None, previous=None):
+    # Fit a model on `df`. With `config.warm_start` and a compatible `previous` model,
+    # only new trees are grown instead of refitting the whole forest.
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+    from sklearn.model_selection import train_test_split
+
+    ml_df = prepare_training_frame(df)
+    if data_hash is None:
+        data_hash = frame_hash(ml_df)
+    X_raw = ml_df.drop(TARGET, axis=1)
+    y = (ml_df[TARGET].astype(str) == 'Yes').astype(int).to_numpy()
+
+    # --- Train/test split ---
+    # Stable per employee; frames without EmployeeNumber (or too small for both sides) use
+    # a random split, and are then not safe to warm-start.
+    train_rows = test_rows = np.empty(0, dtype=np.intp)
+    if 'EmployeeNumber' in df.columns:
+        complete = df.drop(columns=[c for c in ID_COLUMNS if c in df.columns]).notna().all(axis=1).to_numpy()
+        train_rows, test_rows = split_rows(df['EmployeeNumber'].to_numpy()[complete], config.test_size, config.random_state)
+    if not len(train_rows) or not len(test_rows):
+        train_rows, test_rows = train_test_split(
+            np.arange(len(ml_df)), test_size=config.test_size, random_state=config.random_state
+        )
+
+    # --- Encode and scale features ---
+    # A warm start must reuse the previous codes and scaling, or its trees would be wrong.
+    warm = config.warm_start and previous is not None and previous.pipeline.covers(X_raw)
+    pipeline = previous.pipeline if warm else FeaturePipeline.fit(X_raw, train_rows)
+    X, _ = pipeline.transform(X_raw)
+    X_train, X_test = X[train_rows], X[test_rows]
+    y_train, y_test = y[train_rows], y[test_rows]
+
+    # --- Train Random Forest model ---
+    lineage = ''
+    if warm:
+        # Copy so the model currently being served is never mutated; new trees get a fresh seed.
+        lineage = next_lineage(previous, config)
+        rf = copy.deepcopy(previous.model)
+        if len(rf.estimators_) + config.warm_start_trees > config.max_estimators:
+            rf.estimators_ = rf.estimators_[config.warm_start_trees:]
+        rf.set_params(warm_start=True, n_jobs=config.n_jobs, random_state=int(lineage[:8], 16),
+                      n_estimators=len(rf.estimators_) + config.warm_start_trees)
+    else:
+        rf = RandomForestClassifier(**config.model_params())
+    rf.fit(X_train, y_train)
+    y_pred = rf.predict(X_test)
+
+    # --- Metrics ---
+    report = classification_report(y_test, y_pred, target_names=['Stay', 'Leave'], output_dict=True)
+    cm = confusion_matrix(y_test, y_pred)
+    feat_importance = pd.DataFrame({
+        'Feature': pipeline.feature_names,
+        'Importance': rf.feature_importances_
+    }).sort_values(by='Importance', ascending=False)
+
+    return AttritionModel(
+        data_hash=data_hash,
+        config=config,
+        pipeline=pipeline,
+        model=rf,
+        accuracy=accuracy_score(y_test, y_pred),
+        report_df=pd.DataFrame(report).transpose(),
+        cm_df=pd.DataFrame(cm, index=['Actual Stay', 'Actual Leave'], columns=['Pred Stay', 'Pred Leave']),
+        feature_importance=feat_importance,
+        lineage=lineage,
+    )
+
+
+# --- Scoring ---
+def predict_attrition_risk(bundle, frame):
+    # Probability of leaving for each scoreable row; NaN for rows that cannot be encoded.
+    X, valid = bundle.pipeline.transform(frame)
+    risk = np.full(len(frame), np.nan)
+    if len(X):
+        risk[valid] = bundle.predict_proba(X)
+    return risk
+
+
+# --- Persistence ---
+def save_model(bundle, model_dir=MODEL_DIR):
+    import joblib
+
+    # Write to a temporary file first so a concurrent reader never sees a partial artifact.
+    # Warm-started models are stored under their lineage, never under the full-fit key.
+    os.makedirs(model_dir, exist_ok=True)
+    path = model_path(bundle.data_hash, bundle.config, model_dir, bundle.lineage)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    joblib.dump(bundle, tmp_path)
+    os.replace(tmp_path, path)
+    prune_models(model_dir, keep=MODELS_KEPT)
+    return path
+
+
+def prune_models(model_dir=MODEL_DIR, keep=MODELS_KEPT):
+    # Remove all but the `keep` most recently written artifacts (every data change saves one).
+    paths = [os.path.join(model_dir, f) for f in os.listdir(model_dir) if f.endswith('.joblib')]
+    for path in sorted(paths, key=os.path.getmtime, reverse=True)[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Removed by another process already
+
+
+def load_model(data_hash, config=DEFAULT_CONFIG, model_dir=MODEL_DIR, lineage=''):
+    path = model_path(data_hash, config, model_dir, lineage)
+    if not os.path.exists(path):
+        return None
+    import joblib
+
+    try:
+        return joblib.load(path)
+    except Exception:
+        return None  # Corrupt or incompatible artifact: retrain
+
+
+def load_latest_model(model_dir=MODEL_DIR):
+    # Most recently written artifact, for offline jobs that just need "the current model".
+    if not os.path.isdir(model_dir):
+        return None
+    import joblib
+
+    paths = [os.path.join(model_dir, f) for f in os.listdir(model_dir) if f.endswith('.joblib')]
+    for path in sorted(paths, key=os.path.getmtime, reverse=True):
+        try:
+            return joblib.load(path)
+        except Exception:
+            continue
+    return None
+
+
+def load_or_train(df, config=DEFAULT_CONFIG, model_dir=MODEL_DIR):
+    # Return the persisted model for this data/config pair, training it if needed.
+    data_hash = frame_hash(prepare_training_frame(df))
+    bundle = load_model(data_hash, config, model_dir)
+    if bundle is None:
+        bundle = train_model(df, config, data_hash=data_hash)
+        save_model(bundle, model_dir)
+    return bundle
+
+
+# --- Background Training (stale-while-revalidate) ---
+# Fits models on a single worker thread. Callers always get the most recent finished
+# model straight away; when the training data changes a refit is scheduled and the new
+# model is swapped in atomically once it is ready. A failed fit is remembered (last_error)
+# and not retried for the same data, so a persistent error does not refit on every rerun.
+class BackgroundTrainer:
+    def __init__(self, config=DEFAULT_CONFIG, model_dir=MODEL_DIR):
+        self.config = config
+        self.model_dir = model_dir
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='attrition-trainer')
+        self._current = None
+        self._pending_hash = None
+        self._failed_hash = None  # Data whose fit failed; not retried until the data changes
+        self._future = None
+
+    @property
+    def current(self):
+        return self._current
+
+    @property
+    def is_training(self):
+        return self._pending_hash is not None
+
+    def request(self, df, data_hash=None):
+        # Return the model to serve now and make sure one for `df` is on its way.
+        if data_hash is None:
+            data_hash = frame_hash(prepare_training_frame(df))
+        with self._lock:
+            if self._current is not None and self._current.data_hash == data_hash:
+                return self._current
+            if self._pending_hash == data_hash or self._failed_hash == data_hash:
+                return self._current
+            bundle = load_model(data_hash, self.config, self.model_dir)
+            if bundle is not None:
+                self._current = bundle
+                self._pending_hash = None
+                return bundle
+            self._pending_hash = data_hash
+            self._future = self._executor.submit(self._train, df.copy(), data_hash)
+            return self._current
+
+    def wait(self, timeout=None):
+        # Block until the scheduled refit (if any) finishes and return the current model.
+        future = self._future
+        if future is not None:
+            future.result(timeout=timeout)
+        if self._current is None and self.last_error is not None:
+            raise self.last_error
+        return self._current
+
+    def _train(self, df, data_hash):
+        if self._pending_hash != data_hash:
+            return None  # Superseded by a newer request while queued
+        try:
+            bundle = train_model(df, self.config, data_hash=data_hash, previous=self._current)
+            save_model(bundle, self.model_dir)
+        except Exception as e:
+            with self._lock:
+                self.last_error = e
+                self._failed_hash = data_hash
+                if self._pending_hash == data_hash:
+                    self._pending_hash = None
+            return None
+        with self._lock:
+            if self._pending_hash == data_hash:
+                self._current = bundle
+                self._pending_hash = None
+                self._failed_hash = None
+                self.last_error = None
+        return bundle
@@ -0,0 +1,74 @@
+
+# =========================
+# Paginated Employee Queries
+# =========================
+# Server-side paging for the dashboard's employee grids: SQLite sorts and slices the
+# table, so only the rows of the visible page are read into pandas and sent to the browser.
+#
+# Pages sorted by EmployeeNumber (the primary key) can be fetched with keyset pagination
+# (`WHERE EmployeeNumber > last key of the previous page`), which stays fast for deep
+# pages. Other sort orders use LIMIT/OFFSET with EmployeeNumber as the tie-breaker, so
+# the order is stable across pages.
+# =========================
+
+# --- Import Libraries ---
+import math
+from dataclasses import dataclass
+
+import pandas as pd
+
+from database import EMPLOYEE_COLUMNS, quote
+
+# --- Global Variables & Setup ---
+PAGE_SIZES = [25, 50, 100, 250]
+KEY_COLUMN = 'EmployeeNumber'
+
+
+# --- Page Request ---
+@dataclass(frozen=True)
+class PageRequest:
+    page: int = 1  # 1-based
+    page_size: int = 50
+    sort_by: str = KEY_COLUMN
+    descending: bool = False
+    where: str = ''  # SQL predicate without WHERE (see filters.py), '' for all rows
+    params: tuple = ()
+
+    @property
+    def offset(self):
+        return (self.page - 1) * self.page_size
+
+    def signature(self):
+        # Everything except the page number: pages with the same signature can chain keysets.
+        return (self.page_size, self.sort_by, self.descending, self.where, self.params)
+
+
+def _where_sql(where):
+    return f" WHERE {where}" if where else ""
+
+
+def page_count(total, page_size):
+    return max(1, math.ceil(total / page_size))
+
+
+def fetch_page(conn, request, after=None):
+    # Rows of one page as a DataFrame. `after` is the last EmployeeNumber of the previous
+    # page; it is only used when sorting by EmployeeNumber (keyset pagination).
+    if request.sort_by not in EMPLOYEE_COLUMNS:
+        raise ValueError(f"Unknown sort column: {request.sort_by}")
+    direction = 'DESC' if request.descending else 'ASC'
+    conditions, params = [], list(request.params)
+    if request.where:
+        conditions.append(f"({request.where})")
+    if request.sort_by == KEY_COLUMN:
+        order = f"{KEY_COLUMN} {direction}"
+    else:
+        order = f"{quote(request.sort_by)} {direction}, {KEY_COLUMN} {direction}"
+    offset = request.offset
+    if after is not None and request.sort_by == KEY_COLUMN:
+        conditions.append(f"{KEY_COLUMN} {'<' if request.descending else '>'} ?")
+        params.append(after)
+        offset = 0
+    where = ' AND '.join(conditions)
+    sql = f"SELECT * FROM employee{_where_sql(where)} ORDER BY {order} LIMIT ? OFFSET ?"
+    return pd.read_sql(sql, conn, params=params + [request.page_size, offset])
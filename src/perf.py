@@ -0,0 +1,167 @@
+
+# =========================
+# Section Timing Instrumentation
+# =========================
+# Lightweight timings for the dashboard's sections: wall time, rows processed and the change
+# in process memory (RSS) while the section ran. Timings are kept in a bounded in-memory
+# buffer for the sidebar "Performance" panel and appended to a JSON-lines log, so runs of
+# many sessions can be aggregated later (per-section p50/p95).
+#
+# When recording is off, section() returns one shared no-op context manager: the cost is a
+# method call and an attribute lookup. Memory deltas are process-wide, so they also include
+# allocations made by other sessions' threads running at the same time.
+#
+# Usage:
+#   with recorder.section('kpis') as span:
+#       ...
+#       span.rows = len(frame)
+#
+#   python src/perf.py data/perf.jsonl      # per-section summary of a log
+# =========================
+
+# --- Import Libraries ---
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+# --- Global Variables & Setup ---
+PERF_LOG = 'data/perf.jsonl'
+MAX_TIMINGS = 2000  # Kept in memory for the panel (the log keeps everything)
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+@dataclass
+class Timing:
+    section: str
+    seconds: float
+    rows: int = None
+    memory_delta_bytes: int = None  # None where the platform does not report RSS
+    timestamp: float = None
+
+
+def rss_bytes():
+    # Current resident set size (Linux); None elsewhere.
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# --- Spans ---
+class _NullSpan:
+    # Shared stand-in while recording is off; assignments to `rows` are ignored.
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('recorder', 'section', 'rows', '_start', '_rss')
+
+    def __init__(self, recorder, section, rows):
+        self.recorder, self.section, self.rows = recorder, section, rows
+
+    def __enter__(self):
+        self._rss = rss_bytes()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self._start
+        rss = rss_bytes()
+        delta = rss - self._rss if rss is not None and self._rss is not None else None
+        self.recorder.record(Timing(self.section, seconds, self.rows, delta, time.time()))
+        return False
+
+
+# --- Recorder ---
+class PerfRecorder:
+    def __init__(self, log_path=PERF_LOG, maxlen=MAX_TIMINGS):
+        self.log_path = log_path
+        self._timings = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def section(self, name, enabled=True, rows=None):
+        # Context manager timing one section; set `.rows` on it if known only at the end.
+        if not enabled:
+            return _NULL_SPAN
+        return _Span(self, name, rows)
+
+    def record(self, timing):
+        line = json.dumps(asdict(timing))
+        with self._lock:
+            self._timings.append(timing)
+            if self.log_path is not None:
+                if os.path.dirname(self.log_path):
+                    os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, 'a') as f:
+                    f.write(line + '\n')
+
+    def timings(self):
+        with self._lock:
+            return list(self._timings)
+
+    def clear(self):
+        with self._lock:
+            self._timings.clear()
+
+
+# --- Aggregation ---
+def summarize(timings):
+    # One row per section: runs, p50/p95/max wall time (ms), median rows, mean memory delta (MB).
+    frame = pd.DataFrame([asdict(t) if isinstance(t, Timing) else t for t in timings],
+                         columns=list(Timing.__dataclass_fields__))
+    if frame.empty:
+        return pd.DataFrame(columns=['section', 'runs', 'p50_ms', 'p95_ms', 'max_ms', 'rows', 'memory_delta_mb'])
+    frame['ms'] = frame['seconds'] * 1000
+    grouped = frame.groupby('section', sort=False)
+    summary = pd.DataFrame({
+        'runs': grouped.size(),
+        'p50_ms': grouped['ms'].quantile(0.5),
+        'p95_ms': grouped['ms'].quantile(0.95),
+        'max_ms': grouped['ms'].max(),
+        'rows': grouped['rows'].median(),
+        'memory_delta_mb': grouped['memory_delta_bytes'].mean() / 1e6,
+    })
+    return summary.sort_values('p95_ms', ascending=False).reset_index()
+
+
+def load_log(path=PERF_LOG):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-section summary of a dashboard timing log.")
+    parser.add_argument('log', nargs='?', default=PERF_LOG)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    summary = summarize(load_log(args.log))
+    if args.json:
+        print(summary.to_json(orient='records', indent=2))
+    else:
+        print(summary.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+
+# =========================
+# Attrition Prediction HTTP Endpoint
+# =========================
+# A small local JSON endpoint that runs next to the Streamlit app and scores single
+# employees with the latest persisted model (see model.py). Uses only the standard library.
+#
+# Usage:
+#   python src/predict_server.py --port 8502
+#   curl -X POST localhost:8502/predict -d '{"Age": 30, "Department": "Sales", ...}'
+#
+# POST /predict accepts one employee object or a list of them; missing fields are
+# filled with typical values unless "?strict=1" is given. A list is scored as one frame
+# (vectorized). Values that cannot be converted (e.g. "Age": "abc") get a 400 error.
+# GET /health reports the model.
+# =========================
+
+# --- Import Libraries ---
+import argparse
+import json
+import math
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from model import MODEL_DIR, load_latest_model, predict_attrition_risk
+
+
+def score_records(bundle, records, fill_missing=True):
+    # Leave probability (or None if not scoreable) for each record, in one vectorized pass.
+    frame = pd.DataFrame.from_records(records).reindex(columns=bundle.feature_names)
+    if fill_missing:
+        frame = frame.fillna({col: bundle.pipeline.defaults[col] for col in frame.columns})
+    return [None if math.isnan(risk) else float(risk) for risk in predict_attrition_risk(bundle, frame)]
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    bundle = None  # Set by serve()
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlparse(self.path).path != '/health':
+            self._send_json(404, {'error': 'not found'})
+            return
+        self._send_json(200, {'status': 'ok', 'model': self.bundle.data_hash[:12],
+                              'features': len(self.bundle.feature_names)})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/predict':
+            self._send_json(404, {'error': 'not found'})
+            return
+        strict = parse_qs(url.query).get('strict', ['0'])[0] == '1'
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            self._send_json(400, {'error': 'invalid JSON body'})
+            return
+        records = payload if isinstance(payload, list) else [payload]
+        if not all(isinstance(record, dict) for record in records):
+            self._send_json(400, {'error': 'expected an employee object or a list of them'})
+            return
+
+        try:
+            if isinstance(payload, list):
+                risks = score_records(self.bundle, records, fill_missing=not strict) if records else []
+            else:
+                risks = [self.bundle.predict_one(payload, fill_missing=not strict)]
+        except (ValueError, TypeError) as e:
+            self._send_json(400, {'error': f'invalid field value: {e}'})
+            return
+        results = [{'AttritionRisk': risk} for risk in risks]
+        self._send_json(200, results if isinstance(payload, list) else results[0])
+
+    def log_message(self, format, *args):
+        pass  # Keep the per-request path quiet
+
+
+def serve(host='127.0.0.1', port=8502, model_dir=MODEL_DIR):
+    bundle = load_latest_model(model_dir)
+    if bundle is None:
+        raise SystemExit(f"No persisted model in '{model_dir}'. Open the dashboard or run src/scoring.py first.")
+    PredictionHandler.bundle = bundle
+    server = ThreadingHTTPServer((host, port), PredictionHandler)
+    print(f"Serving attrition predictions with model {bundle.data_hash[:12]} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve single-employee attrition predictions over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--model-dir', default=MODEL_DIR, help="Directory with persisted models")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.model_dir)
+
+
+if __name__ == '__main__':
+    main()
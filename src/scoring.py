@@ -0,0 +1,102 @@
+
+# =========================
+# Batch Attrition Scoring
+# =========================
+# Scores every row of the SQLite `employee` table with the cached attrition model and
+# writes the probabilities to the `employee_risk` side table.
+# Rows are read and scored in chunks on a read-only connection, so memory stays bounded for
+# millions of employees. Each chunk is committed to a staging table in its own short write
+# transaction, and the staging table replaces `employee_risk` in one rename at the end:
+# dashboard writes only ever wait for a single chunk, and readers see the previous scores
+# until the new ones are complete.
+#
+# Usage:
+#   python src/scoring.py --db data/hr.db --chunksize 50000
+# =========================
+
+# --- Import Libraries ---
+import argparse
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from database import DB_NAME, connect
+from frame_cache import load_employee_frame_cached
+from model import MODEL_DIR, load_latest_model, load_or_train, predict_attrition_risk
+
+# --- Global Variables & Setup ---
+RISK_TABLE = 'employee_risk'
+STAGING_TABLE = 'employee_risk_staging'
+CHUNKSIZE = 50_000
+
+
+def ensure_risk_table(conn, table=RISK_TABLE):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            EmployeeNumber INTEGER PRIMARY KEY,
+            AttritionRisk REAL NOT NULL,
+            ModelHash TEXT NOT NULL,
+            ScoredAt TEXT NOT NULL
+        )""")
+
+
+def iter_risk_chunks(reader, bundle, chunksize=CHUNKSIZE):
+    # Yield one list of (EmployeeNumber, AttritionRisk, ModelHash, ScoredAt) tuples per chunk.
+    columns = ', '.join(f'"{c}"' for c in ['EmployeeNumber'] + bundle.feature_names)
+    scored_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    for chunk in pd.read_sql(f"SELECT {columns} FROM employee", reader, chunksize=chunksize):
+        risk = predict_attrition_risk(bundle, chunk)
+        scored = ~np.isnan(risk)
+        emp_nums = chunk['EmployeeNumber'].to_numpy()[scored].tolist()
+        yield [(int(emp_num), value, bundle.data_hash, scored_at)
+               for emp_num, value in zip(emp_nums, risk[scored].tolist())]
+
+
+def score_employees(conn, reader, bundle, chunksize=CHUNKSIZE):
+    # Replace the contents of the risk table; returns the rows written. Employees are read
+    # on `reader` (read-only), scores are written on `conn`.
+    with conn:
+        conn.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+        ensure_risk_table(conn, STAGING_TABLE)
+    insert = f"INSERT INTO {STAGING_TABLE} (EmployeeNumber, AttritionRisk, ModelHash, ScoredAt) VALUES (?, ?, ?, ?)"
+    written = 0
+    for rows in iter_risk_chunks(reader, bundle, chunksize):
+        with conn:  # One short write transaction per chunk
+            conn.executemany(insert, rows)
+        written += len(rows)
+    with conn:
+        conn.execute(f"DROP TABLE IF EXISTS {RISK_TABLE}")
+        conn.execute(f"ALTER TABLE {STAGING_TABLE} RENAME TO {RISK_TABLE}")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score every employee's attrition risk.")
+    parser.add_argument('--db', default=DB_NAME, help="SQLite database with the employee table")
+    parser.add_argument('--model-dir', default=MODEL_DIR, help="Directory with persisted models")
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE, help="Rows scored per chunk")
+    args = parser.parse_args()
+
+    # Scoring holds the write lock for one chunk at a time, so it can run while the dashboard
+    # is serving (its writes wait at most that long, well within busy_timeout).
+    conn = connect(args.db)
+    reader = connect(args.db, read_only=True)
+    bundle = load_latest_model(args.model_dir)
+    if bundle is None:
+        print("No persisted model found, training one on the employee table...")
+        frame, _ = load_employee_frame_cached(reader)  # Same frame (and model hash) as the dashboard
+        bundle = load_or_train(frame, model_dir=args.model_dir)
+
+    start = time.perf_counter()
+    written = score_employees(conn, reader, bundle, args.chunksize)
+    elapsed = time.perf_counter() - start
+    reader.close()
+    conn.close()
+    print(f"Scored {written} employees into '{RISK_TABLE}' in {elapsed:.2f}s "
+          f"({written / elapsed if elapsed else 0:,.0f} rows/s) with model {bundle.data_hash[:12]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+
+# =========================
+# Shared Employee Snapshot
+# =========================
+# One process-wide, read-only copy of the employee frame for all dashboard sessions.
+# Each snapshot carries the data version (database.data_version) it reflects; sessions
+# only remember that version number instead of keeping their own copy of the table.
+#
+# Snapshots are never modified in place. A write builds a new frame from the current
+# one (copy-on-write: unchanged columns are shared, see frames.py) and swaps it in, so
+# a session that is still rendering the previous snapshot keeps a consistent view.
+# =========================
+
+# --- Import Libraries ---
+import threading
+from dataclasses import dataclass, replace
+
+import pandas as pd
+
+from database import data_version
+from frames import load_employee_frame
+
+
+# --- Snapshot ---
+@dataclass(frozen=True)
+class EmployeeSnapshot:
+    version: int
+    frame: pd.DataFrame  # Shared by all sessions: never modify, derive a new frame instead
+    memory_report: dict  # From the last full load (see frames.load_employee_frame)
+
+
+# --- Store ---
+class EmployeeStore:
+    def __init__(self, loader=load_employee_frame):
+        self._loader = loader  # conn -> (frame, memory report)
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    def _load(self, conn):
+        # Full reload. Retried if a write lands between reading the version and the rows.
+        while True:
+            version = data_version(conn)
+            frame, report = self._loader(conn)
+            if data_version(conn) == version:
+                return EmployeeSnapshot(version, frame, report)
+
+    def current(self, conn):
+        # Snapshot matching the database's current data version, reloading only if it moved on.
+        version = data_version(conn)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != data_version(conn):
+                self._snapshot = self._load(conn)
+            return self._snapshot
+
+    def apply(self, conn, new_version, patch):
+        # Publish a committed write: patch(frame) -> new frame. If the new version is not
+        # exactly one ahead of the snapshot, another writer got in between: reload instead.
+        # patch=None always reloads (bulk changes touching many rows).
+        with self._lock:
+            snapshot = self._snapshot
+            if patch is None or snapshot is None or snapshot.version + 1 != new_version:
+                self._snapshot = self._load(conn)
+            else:
+                self._snapshot = replace(snapshot, version=new_version, frame=patch(snapshot.frame))
+            return self._snapshot
@@ -0,0 +1,240 @@
+
+# =========================
+# Synthetic Workforce Generator
+# =========================
+# Generates employee tables of any size that look like the source CSV, for scale testing.
+# fit_workforce() learns the source's distributions, generate() samples them in chunks:
+#   - Department x JobRole x JobLevel x OverTime x Attrition are drawn jointly from the
+#     observed combinations, so headcount per department/role and the OverTime/Attrition
+#     relationship are preserved.
+#   - Column blocks that must stay consistent with each other are drawn together from one
+#     source employee with the same conditioning values: career history by JobLevel (years
+#     at company never exceed total working years, age fits the career length), and
+#     MonthlyIncome by JobRole x JobLevel, jittered within that group's observed range.
+#   - PerformanceRating and PercentSalaryHike are drawn jointly (ratings follow hikes).
+#   - Every other column is drawn from its own observed distribution.
+# Everything is vectorized per chunk, so memory is bounded by the chunk size and output is
+# streamed to CSV, Parquet (needs pyarrow) or the SQLite employee table.
+#
+# Usage:
+#   python src/synth.py --rows 1000000 --format csv --output data/employees-1m.csv
+#   python src/synth.py --rows 10000000 --format sqlite --output data/hr-10m.db --chunksize 500000
+# =========================
+
+# --- Import Libraries ---
+import argparse
+import itertools
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency (Parquet output only)
+    pa = pq = None
+
+from database import CSV_PATH, EMPLOYEE_COLUMNS, bump_version, connect, insert_employees_sql, migrate
+
+# --- Global Variables & Setup ---
+CHUNKSIZE = 100_000
+FORMATS = ['csv', 'parquet', 'sqlite']
+KEY_COLUMN = 'EmployeeNumber'
+PROFILE_COLUMNS = ['Department', 'JobRole', 'JobLevel', 'OverTime', 'Attrition']
+# (conditioning columns, columns drawn together from one source employee)
+BLOCKS = [
+    (['JobLevel'], ['Age', 'TotalWorkingYears', 'NumCompaniesWorked', 'YearsAtCompany',
+                    'YearsInCurrentRole', 'YearsSinceLastPromotion', 'YearsWithCurrManager']),
+    (['JobRole', 'JobLevel'], ['MonthlyIncome']),
+    ([], ['PerformanceRating', 'PercentSalaryHike']),
+]
+INCOME_JITTER = 0.05  # Std. dev. of the multiplicative log-normal noise on MonthlyIncome
+
+
+@dataclass
+class _Block:
+    by: list
+    columns: list
+    keys: pd.Index  # Distinct conditioning values (a MultiIndex for several columns)
+    starts: np.ndarray  # Offset of each key's rows in `rows`
+    counts: np.ndarray
+    rows: pd.DataFrame  # Source rows sorted by the conditioning columns
+
+
+@dataclass
+class WorkforceModel:
+    columns: list  # Output column order
+    profile: pd.DataFrame  # Distinct PROFILE_COLUMNS combinations
+    profile_p: np.ndarray  # Their observed frequencies
+    blocks: list
+    marginals: dict  # column -> (values, frequencies)
+    income_range: pd.DataFrame  # min/max MonthlyIncome per JobRole x JobLevel
+
+
+def _key_index(frame, by):
+    if len(by) == 1:
+        return pd.Index(frame[by[0]])
+    return pd.MultiIndex.from_frame(frame[by])
+
+
+def _fit_block(source, by, columns):
+    if not by:
+        rows = source[columns].reset_index(drop=True)
+        return _Block(by, columns, pd.Index([0]), np.array([0]), np.array([len(rows)]), rows)
+    rows = source[by + columns].sort_values(by, kind='stable').reset_index(drop=True)
+    sizes = rows.groupby(by, sort=True).size()
+    counts = sizes.to_numpy()
+    return _Block(by, columns, sizes.index, np.concatenate([[0], np.cumsum(counts)[:-1]]), counts,
+                  rows[columns])
+
+
+def fit_workforce(source):
+    # Learn the distributions generate() samples from. `source` is an employee frame
+    # without missing values in the profile and block columns.
+    source = source.dropna(subset=PROFILE_COLUMNS + [c for _, cols in BLOCKS for c in cols])
+    profile = source.groupby(PROFILE_COLUMNS, sort=True).size()
+    drawn = set(PROFILE_COLUMNS + [c for _, cols in BLOCKS for c in cols] + [KEY_COLUMN])
+    marginals = {}
+    for col in source.columns:
+        if col not in drawn:
+            freq = source[col].value_counts(normalize=True, dropna=False)
+            marginals[col] = (freq.index.to_numpy(), freq.to_numpy())
+    return WorkforceModel(
+        columns=list(source.columns),
+        profile=profile.index.to_frame(index=False),
+        profile_p=(profile / profile.sum()).to_numpy(),
+        blocks=[_fit_block(source, by, cols) for by, cols in BLOCKS],
+        marginals=marginals,
+        income_range=source.groupby(['JobRole', 'JobLevel'])['MonthlyIncome'].agg(['min', 'max']),
+    )
+
+
+def load_source(csv_path=CSV_PATH):
+    return pd.read_csv(csv_path)
+
+
+# --- Sampling ---
+def _sample_block(block, out, rng):
+    # For each output row, pick a random source row with the same conditioning values.
+    n = len(out)
+    if block.by:
+        key = block.keys.get_indexer(_key_index(out, block.by))
+        if (key < 0).any():
+            raise ValueError(f"Generated {block.by} values missing from the source")
+    else:
+        key = np.zeros(n, dtype=np.intp)
+    donor = block.starts[key] + (rng.random(n) * block.counts[key]).astype(np.intp)
+    for col in block.columns:
+        out[col] = block.rows[col].to_numpy()[donor]
+
+
+def _jitter_income(model, out, rng):
+    bounds = model.income_range.reindex(pd.MultiIndex.from_frame(out[['JobRole', 'JobLevel']]))
+    income = out['MonthlyIncome'].to_numpy(dtype=np.float64) * np.exp(rng.normal(0, INCOME_JITTER, len(out)))
+    out['MonthlyIncome'] = np.clip(income, bounds['min'].to_numpy(), bounds['max'].to_numpy()).round().astype(np.int64)
+
+
+def sample_chunk(model, n_rows, rng, first_number=1):
+    profile = rng.choice(len(model.profile), size=n_rows, p=model.profile_p)
+    out = model.profile.iloc[profile].reset_index(drop=True)
+    for block in model.blocks:
+        _sample_block(block, out, rng)
+    _jitter_income(model, out, rng)
+    for col, (values, p) in model.marginals.items():
+        out[col] = values[rng.choice(len(values), size=n_rows, p=p)]
+    out[KEY_COLUMN] = np.arange(first_number, first_number + n_rows, dtype=np.int64)
+    return out[model.columns]
+
+
+def generate(model, n_rows, chunksize=CHUNKSIZE, seed=0, first_number=1):
+    # Yield DataFrames of at most `chunksize` rows, `n_rows` in total, with consecutive
+    # EmployeeNumbers starting at `first_number`. Same seed and chunksize, same output.
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, chunksize):
+        size = min(chunksize, n_rows - start)
+        yield sample_chunk(model, size, rng, first_number + start)
+
+
+def synthetic_frame(n_rows, seed=0, source=None):
+    # Whole synthetic table in memory (for tests and benchmarks).
+    model = fit_workforce(load_source() if source is None else source)
+    return pd.concat(generate(model, n_rows, seed=seed), ignore_index=True)
+
+
+# --- Writers ---
+def write_csv(chunks, path):
+    rows = 0
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks, path):
+    if pa is None:
+        raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+    rows, writer = 0, None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_sqlite(chunks, path):
+    # Upsert into the employee table (migrated first) in one transaction.
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        return 0
+    columns = [c for c in first.columns if c in EMPLOYEE_COLUMNS]
+    rows = 0
+
+    def records():
+        nonlocal rows
+        for chunk in itertools.chain([first], chunks):
+            rows += len(chunk)
+            yield from chunk[columns].itertuples(index=False, name=None)
+
+    conn = connect(path)
+    migrate(conn)
+    with conn:
+        conn.executemany(insert_employees_sql(columns), records())
+        bump_version(conn)
+    conn.close()
+    return rows
+
+
+WRITERS = {'csv': write_csv, 'parquet': write_parquet, 'sqlite': write_sqlite}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic employee table for scale testing.")
+    parser.add_argument('--rows', type=lambda s: int(float(s)), required=True, help="Rows to generate (e.g. 1e6)")
+    parser.add_argument('--format', choices=FORMATS, default='csv')
+    parser.add_argument('--output', required=True, help="CSV / Parquet file or SQLite database")
+    parser.add_argument('--source', default=CSV_PATH, help="CSV whose distributions are reproduced")
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = fit_workforce(load_source(args.source))
+    if os.path.dirname(args.output):
+        os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    rows = WRITERS[args.format](generate(model, args.rows, args.chunksize, args.seed), args.output)
+    seconds = time.perf_counter() - start
+    print(f"Wrote {rows:,} synthetic employees to '{args.output}' in {seconds:.1f}s ({rows / seconds:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()